@@ -4,33 +4,40 @@ Pacote crypto_io
 Funções auxiliares para entrada/saída e conversões
 """
 
-from .util_io import (
-    inteiro_para_bytes,
-    bytes_para_inteiro,
-    ler_bytes,
-    escrever_bytes,
-    ler_texto,
-    escrever_texto,
-    texto_para_inteiro,
-    inteiro_para_texto,
-)
+from ._importacao import exportar_sob_demanda
 
-from .normalizador import (
-    remover_acentos,
-    somente_letras,
-    normalizar_texto,
-)
+_EXPORTACOES = {
+    "inteiro_para_bytes": ".util_io",
+    "bytes_para_inteiro": ".util_io",
+    "ler_bytes": ".util_io",
+    "escrever_bytes": ".util_io",
+    "ler_texto": ".util_io",
+    "escrever_texto": ".util_io",
+    "iterar_texto": ".util_io",
+    "EscritorTexto": ".util_io",
+    "escrever_texto_em_blocos": ".util_io",
+    "mapear_bytes": ".util_io",
+    "liberar_mapa": ".util_io",
+    "bytes_mapeados": ".util_io",
+    "TextoMapeado": ".util_io",
+    "texto_para_inteiro": ".util_io",
+    "inteiro_para_texto": ".util_io",
+    "remover_acentos": ".normalizador",
+    "somente_letras": ".normalizador",
+    "normalizar_texto": ".normalizador",
+    "normalizar_fluxo": ".normalizador",
+    "somente_letras_fluxo": ".normalizador",
+    "tamanho_bloco_para_modulo": ".blocos_rsa",
+    "BlocosInteiros": ".blocos_rsa",
+    "bytes_para_blocos": ".blocos_rsa",
+    "texto_para_blocos": ".blocos_rsa",
+    "blocos_para_bytes": ".blocos_rsa",
+    "blocos_para_texto": ".blocos_rsa",
+    "Corpus": ".corpus",
+    "carregar_corpus": ".corpus",
+    "histograma_letras": ".corpus",
+}
 
-__all__ = [
-    "inteiro_para_bytes",
-    "bytes_para_inteiro",
-    "ler_bytes",
-    "escrever_bytes",
-    "ler_texto",
-    "escrever_texto",
-    "texto_para_inteiro",
-    "inteiro_para_texto",
-    "remover_acentos",
-    "somente_letras",
-    "normalizar_texto",
-]
\ No newline at end of file
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportar_sob_demanda(__name__, globals(), _EXPORTACOES)
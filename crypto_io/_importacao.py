@@ -0,0 +1,29 @@
+"""
+Importação sob demanda dos nomes exportados por um pacote (PEP 562).
+"""
+
+from importlib import import_module
+from typing import Callable, Dict, List, Tuple
+
+
+def exportar_sob_demanda(pacote: str, globais: dict, exportacoes: Dict[str, str]
+                         ) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Devolve (__getattr__, __dir__) para o módulo de um pacote.
+
+    exportacoes mapeia cada nome ao submódulo relativo que o define; o
+    submódulo só é importado no primeiro acesso ao nome, que passa a ficar
+    em globais.
+    """
+    def __getattr__(nome: str):
+        modulo = exportacoes.get(nome)
+        if modulo is None:
+            raise AttributeError(f"module {pacote!r} has no attribute {nome!r}")
+        valor = getattr(import_module(modulo, pacote), nome)
+        globais[nome] = valor
+        return valor
+
+    def __dir__():
+        return sorted(set(globais) | set(exportacoes))
+
+    return __getattr__, __dir__
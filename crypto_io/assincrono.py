@@ -0,0 +1,130 @@
+"""
+Módulo: assincrono.py
+Versões asyncio das funções de entrada/saída de crypto_io.
+
+As operações de arquivo rodam num ThreadPoolExecutor limitado, para não
+bloquear o event loop. Cancelar a tarefa que aguarda uma operação faz
+com que o resultado seja descartado (a chamada de sistema em andamento
+não é interrompida).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import AsyncIterator, Iterable, Optional
+import asyncio
+import threading
+
+from .util_io import (
+    BytesLike,
+    TAMANHO_BLOCO_PADRAO,
+    FSYNC_NUNCA,
+    ler_bytes,
+    escrever_bytes,
+    ler_texto,
+    escrever_texto,
+    iterar_texto,
+    escrever_texto_em_blocos,
+)
+from .corpus import Corpus, carregar_corpus, NOME_INDICE
+
+MAX_WORKERS_IO_PADRAO = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_trava = threading.Lock()
+
+
+def configurar_executor_io(max_workers: int = MAX_WORKERS_IO_PADRAO) -> None:
+    """
+    Define o número máximo de threads usadas para E/S assíncrona.
+    O executor anterior (se houver) é encerrado após concluir o que já recebeu.
+    """
+    global _executor
+    if max_workers <= 0:
+        raise ValueError("max_workers deve ser positivo.")
+    with _trava:
+        antigo = _executor
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crypto_io")
+    if antigo is not None:
+        antigo.shutdown(wait=False)
+
+
+def _obter_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _trava:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS_IO_PADRAO, thread_name_prefix="crypto_io")
+        return _executor
+
+
+async def _em_thread(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_obter_executor(), partial(func, *args, **kwargs))
+
+
+async def ler_bytes_async(caminho: str) -> bytes:
+    return await _em_thread(ler_bytes, caminho)
+
+
+async def escrever_bytes_async(caminho: str, dados: BytesLike) -> None:
+    await _em_thread(escrever_bytes, caminho, dados)
+
+
+async def ler_texto_async(caminho: str, codificacao: str = "utf-8") -> str:
+    return await _em_thread(ler_texto, caminho, codificacao)
+
+
+async def escrever_texto_async(caminho: str, texto: str, codificacao: str = "utf-8") -> None:
+    await _em_thread(escrever_texto, caminho, texto, codificacao)
+
+
+async def iterar_texto_async(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                             codificacao: str = "utf-8") -> AsyncIterator[str]:
+    """
+    Versão assíncrona de iterar_texto: cada bloco é lido numa thread do executor.
+
+    Se a tarefa for cancelada durante uma leitura, o gerador (e o arquivo)
+    é fechado na thread, assim que essa leitura termina.
+    """
+    blocos = await _em_thread(iterar_texto, caminho, tamanho_bloco, codificacao)
+    executor = _obter_executor()
+    fim = object()
+    leitura = None
+    try:
+        while True:
+            leitura = executor.submit(next, blocos, fim)
+            bloco = await asyncio.wrap_future(leitura)
+            leitura = None
+            if bloco is fim:
+                break
+            yield bloco
+    finally:
+        if leitura is None or leitura.done():
+            blocos.close()
+        else:
+            # o gerador ainda está executando na thread: fechar agora daria
+            # "generator already executing"
+            leitura.add_done_callback(lambda _: blocos.close())
+
+
+async def escrever_texto_em_blocos_async(caminho: str, blocos: Iterable[str], codificacao: str = "utf-8",
+                                         tamanho_buffer: int = TAMANHO_BLOCO_PADRAO,
+                                         fsync: str = FSYNC_NUNCA) -> None:
+    await _em_thread(escrever_texto_em_blocos, caminho, blocos, codificacao, tamanho_buffer, fsync)
+
+
+async def carregar_corpus_async(diretorio: str, padrao: str = "*.txt", codificacao: str = "utf-8",
+                                max_workers: Optional[int] = None,
+                                arquivo_indice: Optional[str] = NOME_INDICE) -> Corpus:
+    return await _em_thread(carregar_corpus, diretorio, padrao, codificacao, max_workers, arquivo_indice)
+
+
+__all__ = [
+    "configurar_executor_io",
+    "ler_bytes_async",
+    "escrever_bytes_async",
+    "ler_texto_async",
+    "escrever_texto_async",
+    "iterar_texto_async",
+    "escrever_texto_em_blocos_async",
+    "carregar_corpus_async",
+]
@@ -0,0 +1,121 @@
+"""
+Módulo: blocos_rsa.py
+Codificação texto <-> inteiros em blocos do tamanho do módulo RSA.
+
+texto_para_inteiro gera um único inteiro, que precisa ser menor que n.
+Aqui os bytes UTF-8 são divididos em blocos de tamanho fixo, cada um
+garantidamente menor que n, e os inteiros são gerados sob demanda.
+"""
+
+from collections.abc import Sequence
+from typing import Iterable, Union
+
+from .util_io import BytesLike
+
+
+def tamanho_bloco_para_modulo(n: int) -> int:
+    """
+    Maior número de bytes k tal que qualquer bloco de k bytes seja < n.
+    """
+    if not isinstance(n, int) or n < 256:
+        raise ValueError("O módulo n deve ser um inteiro >= 256.")
+    return (n.bit_length() - 1) // 8
+
+
+class BlocosInteiros(Sequence):
+    """
+    Sequência preguiçosa de inteiros sobre um buffer de bytes.
+
+    O i-ésimo elemento é o inteiro (big-endian) do i-ésimo bloco de
+    tamanho_bloco bytes; o último bloco pode ser menor. Nenhum inteiro é
+    calculado antes de ser pedido, e fatias devolvem listas (lotes).
+    """
+
+    __slots__ = ("dados", "tamanho_bloco", "tamanho_total")
+
+    def __init__(self, dados: BytesLike, tamanho_bloco: int):
+        if tamanho_bloco <= 0:
+            raise ValueError("tamanho_bloco deve ser positivo.")
+        self.dados = memoryview(dados).cast("B")
+        self.tamanho_bloco = tamanho_bloco
+        self.tamanho_total = len(self.dados)
+
+    def __len__(self) -> int:
+        return -(-self.tamanho_total // self.tamanho_bloco)
+
+    def _bloco(self, i: int) -> int:
+        inicio = i * self.tamanho_bloco
+        return int.from_bytes(self.dados[inicio:inicio + self.tamanho_bloco], "big")
+
+    def __getitem__(self, indice: Union[int, slice]):
+        if isinstance(indice, slice):
+            return [self._bloco(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de bloco fora do intervalo")
+        return self._bloco(indice)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._bloco(i)
+
+    def lotes(self, tamanho_lote: int):
+        """Percorre os blocos em listas de até tamanho_lote inteiros."""
+        if tamanho_lote <= 0:
+            raise ValueError("tamanho_lote deve ser positivo.")
+        for inicio in range(0, len(self), tamanho_lote):
+            yield self[inicio:inicio + tamanho_lote]
+
+
+def bytes_para_blocos(dados: BytesLike, tamanho_bloco: int) -> BlocosInteiros:
+    """Divide bytes em blocos de tamanho_bloco bytes (sem copiar o buffer)."""
+    if not isinstance(dados, (bytes, bytearray, memoryview)):
+        raise TypeError("A entrada deve ser do tipo bytes ou similar.")
+    return BlocosInteiros(dados, tamanho_bloco)
+
+
+def texto_para_blocos(texto: str, n: int) -> BlocosInteiros:
+    """
+    Converte texto em uma sequência preguiçosa de inteiros menores que n.
+    Guarde .tamanho_total (bytes) para decodificar depois.
+    """
+    if not isinstance(texto, str):
+        raise TypeError("O conteúdo deve ser uma string.")
+    return BlocosInteiros(texto.encode("utf-8"), tamanho_bloco_para_modulo(n))
+
+
+def blocos_para_bytes(inteiros: Iterable[int], tamanho_bloco: int, tamanho_total: int) -> bytes:
+    """
+    Reconstrói os bytes a partir dos inteiros de cada bloco.
+
+    O resultado é escrito num único buffer pré-alocado de tamanho_total bytes.
+    """
+    if tamanho_bloco <= 0:
+        raise ValueError("tamanho_bloco deve ser positivo.")
+    saida = bytearray(tamanho_total)
+    posicao = 0
+    for m in inteiros:
+        tamanho = min(tamanho_bloco, tamanho_total - posicao)
+        if tamanho <= 0:
+            raise ValueError("Há mais blocos do que o tamanho total comporta.")
+        saida[posicao:posicao + tamanho] = m.to_bytes(tamanho, "big")
+        posicao += tamanho
+    if posicao != tamanho_total:
+        raise ValueError("Blocos insuficientes para o tamanho total informado.")
+    return bytes(saida)
+
+
+def blocos_para_texto(inteiros: Iterable[int], n: int, tamanho_total: int) -> str:
+    """Inverso de texto_para_blocos."""
+    return blocos_para_bytes(inteiros, tamanho_bloco_para_modulo(n), tamanho_total).decode("utf-8")
+
+
+__all__ = [
+    "tamanho_bloco_para_modulo",
+    "BlocosInteiros",
+    "bytes_para_blocos",
+    "texto_para_blocos",
+    "blocos_para_bytes",
+    "blocos_para_texto",
+]
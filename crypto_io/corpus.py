@@ -0,0 +1,190 @@
+"""
+Módulo: corpus.py
+Carregamento em lote de um diretório de textos (ex.: examples/textos_base),
+com leitura concorrente e um índice em disco com tamanho, mtime, hash e
+histograma de letras de cada arquivo.
+"""
+
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, Optional
+import fnmatch
+import hashlib
+import json
+import os
+import string
+
+from .normalizador import remover_acentos
+from .util_io import ler_bytes, ler_texto
+
+NOME_INDICE = ".indice_corpus.json"
+VERSAO_INDICE = 1
+
+
+def histograma_letras(texto: str) -> Dict[str, int]:
+    """
+    Conta as letras A–Z do texto, somando as acentuadas à letra base (Ç → C).
+    A contagem é feita por caractere distinto, não por posição.
+    """
+    histograma = {}
+    for caractere, quantidade in Counter(texto.upper()).items():
+        for letra in remover_acentos(caractere):
+            if letra in string.ascii_uppercase:
+                histograma[letra] = histograma.get(letra, 0) + quantidade
+    return dict(sorted(histograma.items()))
+
+
+def _descrever_arquivo(caminho: str, codificacao: str, tentativas: int = 3) -> dict:
+    """
+    Lê um arquivo e calcula sua entrada no índice.
+
+    O stat é feito antes da leitura: se o arquivo mudar no meio, o índice
+    guarda o tamanho/mtime antigos e o próximo carregar() o relê. Enquanto
+    o stat de depois divergir, a leitura é refeita (até tentativas vezes).
+    """
+    for _ in range(tentativas):
+        info = os.stat(caminho)
+        dados = ler_bytes(caminho)
+        depois = os.stat(caminho)
+        if (info.st_size, info.st_mtime_ns) == (depois.st_size, depois.st_mtime_ns):
+            break
+    return {
+        "tamanho": info.st_size,
+        "mtime_ns": info.st_mtime_ns,
+        "sha256": hashlib.sha256(dados).hexdigest(),
+        "histograma": histograma_letras(dados.decode(codificacao)),
+    }
+
+
+class Corpus(Mapping):
+    """
+    Coleção de textos de um diretório, acessados por nome (nome do arquivo sem extensão).
+
+    Os textos são lidos do disco apenas quando acessados. Os metadados ficam
+    num índice ao lado dos arquivos; arquivos com mesmo tamanho e mtime
+    são servidos pelo índice sem nova leitura.
+    """
+
+    def __init__(self, diretorio: str, padrao: str = "*.txt", codificacao: str = "utf-8",
+                 max_workers: Optional[int] = None, arquivo_indice: Optional[str] = NOME_INDICE):
+        if not os.path.isdir(diretorio):
+            raise FileNotFoundError(f"Diretório não encontrado: {diretorio}")
+        self.diretorio = diretorio
+        self.padrao = padrao
+        self.codificacao = codificacao
+        self.max_workers = max_workers
+        self.caminho_indice = os.path.join(diretorio, arquivo_indice) if arquivo_indice else None
+        self._arquivos: Dict[str, str] = {}
+        self._indice: Dict[str, dict] = {}
+
+    # Índice
+
+    def _ler_indice(self) -> Dict[str, dict]:
+        if not self.caminho_indice or not os.path.exists(self.caminho_indice):
+            return {}
+        try:
+            dados = json.loads(ler_texto(self.caminho_indice))
+        except (OSError, ValueError):
+            return {}
+        if dados.get("versao") != VERSAO_INDICE or dados.get("codificacao") != self.codificacao:
+            return {}
+        return dados.get("arquivos", {})
+
+    def _salvar_indice(self) -> None:
+        """Grava o índice; sem permissão de escrita, segue sem persistir."""
+        if not self.caminho_indice:
+            return
+        conteudo = {"versao": VERSAO_INDICE, "codificacao": self.codificacao, "arquivos": self._indice}
+        temporario = self.caminho_indice + ".tmp"
+        try:
+            with open(temporario, "w", encoding="utf-8") as f:
+                json.dump(conteudo, f, ensure_ascii=False)
+            os.replace(temporario, self.caminho_indice)
+        except OSError:
+            try:
+                os.remove(temporario)
+            except OSError:
+                pass
+
+    def _e_indice(self, nome_arquivo: str) -> bool:
+        if not self.caminho_indice:
+            return False
+        nome_indice = os.path.basename(self.caminho_indice)
+        return nome_arquivo in (nome_indice, nome_indice + ".tmp")
+
+    def carregar(self) -> "Corpus":
+        """
+        Varre o diretório e atualiza o índice.
+        Só os arquivos novos ou modificados são lidos, em paralelo.
+        """
+        antigo = self._ler_indice()
+        arquivos = {}
+        with os.scandir(self.diretorio) as entradas:
+            for entrada in entradas:
+                if (entrada.is_file() and fnmatch.fnmatch(entrada.name, self.padrao)
+                        and not self._e_indice(entrada.name)):
+                    arquivos[os.path.splitext(entrada.name)[0]] = entrada
+
+        indice = {}
+        pendentes = []
+        for nome, entrada in arquivos.items():
+            info = entrada.stat()
+            registro = antigo.get(entrada.name)
+            if registro and registro["tamanho"] == info.st_size and registro["mtime_ns"] == info.st_mtime_ns:
+                indice[entrada.name] = registro
+            else:
+                pendentes.append(entrada)
+
+        if pendentes:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                novos = executor.map(lambda e: _descrever_arquivo(e.path, self.codificacao), pendentes)
+                for entrada, registro in zip(pendentes, novos):
+                    indice[entrada.name] = registro
+
+        self._arquivos = {nome: entrada.path for nome, entrada in sorted(arquivos.items())}
+        self._indice = indice
+        if pendentes or set(indice) != set(antigo):
+            self._salvar_indice()
+        return self
+
+    # Acesso
+
+    def _registro(self, nome: str) -> dict:
+        return self._indice[os.path.basename(self._arquivos[nome])]
+
+    def __getitem__(self, nome: str) -> str:
+        if nome not in self._arquivos:
+            raise KeyError(nome)
+        return ler_texto(self._arquivos[nome], self.codificacao)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arquivos)
+
+    def __len__(self) -> int:
+        return len(self._arquivos)
+
+    def caminho(self, nome: str) -> str:
+        return self._arquivos[nome]
+
+    def metadados(self, nome: str) -> dict:
+        """Retorna tamanho, mtime_ns e sha256 do arquivo, sem lê-lo."""
+        registro = self._registro(nome)
+        return {k: v for k, v in registro.items() if k != "histograma"}
+
+    def histograma(self, nome: str) -> Dict[str, int]:
+        """Retorna o histograma de letras A–Z pré-calculado do arquivo."""
+        return dict(self._registro(nome)["histograma"])
+
+
+def carregar_corpus(diretorio: str, padrao: str = "*.txt", codificacao: str = "utf-8",
+                    max_workers: Optional[int] = None, arquivo_indice: Optional[str] = NOME_INDICE) -> Corpus:
+    """Atalho para Corpus(...).carregar()."""
+    return Corpus(diretorio, padrao, codificacao, max_workers, arquivo_indice).carregar()
+
+
+__all__ = [
+    "Corpus",
+    "carregar_corpus",
+    "histograma_letras",
+]
@@ -1,4 +1,6 @@
+import codecs
 import unicodedata
+from typing import Callable, Iterable, Iterator, TextIO, Union
 
 def remover_acentos(texto: str) -> str:
     return ''.join(
@@ -34,4 +36,91 @@ def normalizar_texto(texto, alfabeto=ALFABETO_PADRAO, remover_espacos=False) ->
     if remover_espacos:
         texto_processado = texto_processado.replace(' ', '')
 
-    return texto_processado
\ No newline at end of file
+    return texto_processado
+
+
+# Normalização em fluxo (streaming)
+
+FonteTexto = Union[Iterable[str], Iterable[bytes], TextIO]
+
+TAMANHO_BLOCO_PADRAO = 64 * 1024
+
+
+def _iterar_blocos(fonte: FonteTexto, tamanho_bloco: int) -> Iterator[Union[str, bytes]]:
+    """Percorre a fonte em blocos, seja ela um arquivo aberto ou um iterável."""
+    if hasattr(fonte, "read"):
+        while True:
+            bloco = fonte.read(tamanho_bloco)
+            if not bloco:
+                break
+            yield bloco
+    else:
+        yield from fonte
+
+
+def _separar_grafema_final(texto: str) -> tuple[str, str]:
+    """
+    Separa o texto em (parte completa, grafema final pendente).
+
+    O último caractere base e as marcas combinantes que o seguem ficam
+    pendentes, pois o próximo bloco pode trazer mais marcas para ele.
+    """
+    i = len(texto)
+    while i > 0 and unicodedata.category(texto[i - 1]).startswith('M'):
+        i -= 1
+    if i > 0:
+        i -= 1
+    return texto[:i], texto[i:]
+
+
+def _processar_fluxo(fonte: FonteTexto, funcao: Callable[[str], str], tamanho_bloco: int) -> Iterator[str]:
+    decodificador = None
+    pendente = ''
+
+    for bloco in _iterar_blocos(fonte, tamanho_bloco):
+        if isinstance(bloco, (bytes, bytearray, memoryview)):
+            if decodificador is None:
+                decodificador = codecs.getincrementaldecoder('utf-8')()
+            bloco = decodificador.decode(bloco)
+
+        completo, pendente = _separar_grafema_final(pendente + bloco)
+        if completo:
+            processado = funcao(completo)
+            if processado:
+                yield processado
+
+    if decodificador is not None:
+        pendente += decodificador.decode(b'', final=True)
+
+    if pendente:
+        processado = funcao(pendente)
+        if processado:
+            yield processado
+
+
+def normalizar_fluxo(fonte: FonteTexto, alfabeto=ALFABETO_PADRAO, remover_espacos=False,
+                     tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[str]:
+    """
+    Versão em fluxo de normalizar_texto.
+
+    Aceita um iterável de blocos (str ou bytes UTF-8) ou um arquivo aberto
+    e devolve blocos normalizados. Apenas o último grafema de cada bloco é
+    mantido em memória, para não separar uma letra de seus acentos.
+    """
+    return _processar_fluxo(
+        fonte,
+        lambda texto: normalizar_texto(texto, alfabeto, remover_espacos),
+        tamanho_bloco,
+    )
+
+
+def somente_letras_fluxo(fonte: FonteTexto, alfabeto: str,
+                         tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[str]:
+    """
+    Versão em fluxo de somente_letras (mesmas regras de entrada de normalizar_fluxo).
+    """
+    return _processar_fluxo(
+        fonte,
+        lambda texto: somente_letras(texto, alfabeto),
+        tamanho_bloco,
+    )
@@ -4,12 +4,15 @@ Funções auxiliares para entrada/saída e conversão de dados binários,
 hexadecimais e base64, bem como leitura e escrita de arquivos.
 """
 
-from typing import Optional, Union
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Union
 import base64
+import codecs
+import mmap
 import os
 import string
 
-BytesLike = Union[bytes, bytearray, memoryview]
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
 
 
 # Conversões entre inteiros e bytes
@@ -33,9 +36,9 @@ def inteiro_para_bytes(n: int, tamanho: Optional[int] = None, ordem: str = "big"
 
 def bytes_para_inteiro(b: BytesLike, ordem: str = "big", assinado: bool = False) -> int:
     """Converte bytes para um inteiro."""
-    if not isinstance(b, (bytes, bytearray, memoryview)):
+    if not isinstance(b, (bytes, bytearray, memoryview, mmap.mmap)):
         raise TypeError("A entrada deve ser do tipo bytes ou similar.")
-    return int.from_bytes(bytes(b), byteorder=ordem, signed=assinado)
+    return int.from_bytes(b, byteorder=ordem, signed=assinado)
 
 
 # Leitura e escrita de arquivos
@@ -53,11 +56,11 @@ def ler_bytes(caminho: str) -> bytes:
 
 def escrever_bytes(caminho: str, dados: BytesLike) -> None:
     """Escreve bytes em um arquivo (cria diretórios se necessário)."""
-    if not isinstance(dados, (bytes, bytearray, memoryview)):
+    if not isinstance(dados, (bytes, bytearray, memoryview, mmap.mmap)):
         raise TypeError("Os dados devem ser do tipo bytes ou similar.")
     os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
     with open(caminho, "wb") as f:
-        f.write(bytes(dados))
+        f.write(dados)
 
 
 def ler_texto(caminho: str, codificacao: str = "utf-8") -> str:
@@ -80,6 +83,213 @@ def escrever_texto(caminho: str, texto: str, codificacao: str = "utf-8") -> None
         f.write(texto)
 
 
+# Leitura e escrita em blocos (streaming)
+
+TAMANHO_BLOCO_PADRAO = 64 * 1024
+
+FSYNC_NUNCA = "nunca"
+FSYNC_AO_FECHAR = "ao_fechar"
+FSYNC_A_CADA_BLOCO = "a_cada_bloco"
+POLITICAS_FSYNC = (FSYNC_NUNCA, FSYNC_AO_FECHAR, FSYNC_A_CADA_BLOCO)
+
+
+def _decodificar_blocos(caminho: str, tamanho_bloco: int, codificacao: str) -> Iterator[str]:
+    try:
+        f = open(caminho, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
+    except OSError as e:
+        raise OSError(f"Erro ao ler o arquivo {caminho}: {e}")
+    with f:
+        decodificador = codecs.getincrementaldecoder(codificacao)()
+        while True:
+            dados = f.read(tamanho_bloco)
+            if not dados:
+                break
+            bloco = decodificador.decode(dados)
+            if bloco:
+                yield bloco
+        resto = decodificador.decode(b"", final=True)
+        if resto:
+            yield resto
+
+
+def iterar_texto(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO, codificacao: str = "utf-8") -> Iterator[str]:
+    """
+    Lê um arquivo de texto em blocos de até tamanho_bloco bytes.
+
+    Caracteres multibyte cortados entre dois blocos são completados
+    no bloco seguinte. Um arquivo inexistente é acusado já na chamada; o
+    arquivo só é aberto na primeira iteração (e fechado ao fim dela), de
+    modo que um gerador nunca percorrido não deixa nada aberto.
+    """
+    if tamanho_bloco <= 0:
+        raise ValueError("tamanho_bloco deve ser positivo.")
+    if not os.path.isfile(caminho):
+        raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
+    return _decodificar_blocos(caminho, tamanho_bloco, codificacao)
+
+
+class EscritorTexto:
+    """
+    Escritor incremental de texto com buffer próprio.
+
+    O texto é codificado aos poucos e gravado quando o buffer passa de
+    tamanho_buffer bytes. A política de fsync define quando os dados são
+    forçados para o disco: "nunca", "ao_fechar" ou "a_cada_bloco".
+    """
+
+    def __init__(self, caminho: str, codificacao: str = "utf-8", tamanho_buffer: int = TAMANHO_BLOCO_PADRAO,
+                 fsync: str = FSYNC_NUNCA):
+        if tamanho_buffer <= 0:
+            raise ValueError("tamanho_buffer deve ser positivo.")
+        if fsync not in POLITICAS_FSYNC:
+            raise ValueError(f"Política de fsync inválida: {fsync!r}. Use uma de {POLITICAS_FSYNC}.")
+        os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+        self.caminho = caminho
+        self.tamanho_buffer = tamanho_buffer
+        self.fsync = fsync
+        self._codificador = codecs.getincrementalencoder(codificacao)()
+        self._buffer = bytearray()
+        self._arquivo = open(caminho, "wb")
+
+    def escrever(self, texto: str) -> None:
+        if not isinstance(texto, str):
+            raise TypeError("O conteúdo deve ser uma string.")
+        self._buffer += self._codificador.encode(texto)
+        if len(self._buffer) >= self.tamanho_buffer:
+            self.descarregar()
+
+    def escrever_blocos(self, blocos: Iterable[str]) -> None:
+        for bloco in blocos:
+            self.escrever(bloco)
+
+    def descarregar(self) -> None:
+        """Grava o buffer no arquivo (e faz fsync se a política for a_cada_bloco)."""
+        if self._buffer:
+            # arquivo com buffer: write grava tudo ou lança exceção
+            self._arquivo.write(self._buffer)
+            self._arquivo.flush()
+            self._buffer.clear()
+            if self.fsync == FSYNC_A_CADA_BLOCO:
+                os.fsync(self._arquivo.fileno())
+
+    def fechar(self) -> None:
+        if self._arquivo.closed:
+            return
+        try:
+            self._buffer += self._codificador.encode("", final=True)
+            self.descarregar()
+            if self.fsync == FSYNC_AO_FECHAR:
+                os.fsync(self._arquivo.fileno())
+        finally:
+            self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def escrever_texto_em_blocos(caminho: str, blocos: Iterable[str], codificacao: str = "utf-8",
+                             tamanho_buffer: int = TAMANHO_BLOCO_PADRAO, fsync: str = FSYNC_NUNCA) -> None:
+    """Escreve uma sequência de blocos de texto em um arquivo, sem juntá-los em memória."""
+    with EscritorTexto(caminho, codificacao, tamanho_buffer, fsync) as escritor:
+        escritor.escrever_blocos(blocos)
+
+
+# Leitura mapeada em memória (mmap)
+
+def mapear_bytes(caminho: str) -> memoryview:
+    """
+    Mapeia um arquivo em memória e retorna um memoryview somente leitura.
+
+    As páginas são carregadas pelo sistema operacional sob demanda, então
+    arquivos grandes não são copiados para a memória do processo. O
+    mapeamento fica aberto até liberar_mapa(visao); prefira o gerenciador
+    de contexto bytes_mapeados.
+    """
+    try:
+        with open(caminho, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Arquivo não encontrado: {caminho}")
+    except OSError as e:
+        raise OSError(f"Erro ao mapear o arquivo {caminho}: {e}")
+    return memoryview(mapa)
+
+
+def liberar_mapa(visao: memoryview) -> None:
+    """Libera um memoryview de mapear_bytes e fecha o mmap por trás dele."""
+    obj = visao.obj
+    visao.release()
+    if isinstance(obj, mmap.mmap):
+        obj.close()
+
+
+@contextmanager
+def bytes_mapeados(caminho: str) -> Iterator[memoryview]:
+    """
+    mapear_bytes como gerenciador de contexto: o mapeamento é fechado na
+    saída do bloco (visões derivadas deixam de ser válidas).
+    """
+    visao = mapear_bytes(caminho)
+    try:
+        yield visao
+    finally:
+        liberar_mapa(visao)
+
+
+class TextoMapeado:
+    """
+    Visão de texto sobre um arquivo mapeado em memória.
+
+    O conteúdo só é decodificado quando pedido, bloco a bloco,
+    com tratamento correto de caracteres multibyte entre blocos.
+    """
+
+    def __init__(self, caminho: str, codificacao: str = "utf-8"):
+        self.caminho = caminho
+        self.codificacao = codificacao
+        self.dados = mapear_bytes(caminho)
+
+    def __len__(self) -> int:
+        """Tamanho em bytes (não em caracteres)."""
+        return len(self.dados)
+
+    def iterar(self, tamanho_bloco: int = 1 << 20) -> Iterator[str]:
+        """Decodifica o arquivo em blocos de até tamanho_bloco bytes."""
+        if tamanho_bloco <= 0:
+            raise ValueError("tamanho_bloco deve ser positivo.")
+        decodificador = codecs.getincrementaldecoder(self.codificacao)()
+        for inicio in range(0, len(self.dados), tamanho_bloco):
+            bloco = decodificador.decode(self.dados[inicio:inicio + tamanho_bloco])
+            if bloco:
+                yield bloco
+        resto = decodificador.decode(b"", final=True)
+        if resto:
+            yield resto
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iterar()
+
+    def __str__(self) -> str:
+        return codecs.decode(self.dados, self.codificacao)
+
+    def fechar(self) -> None:
+        """Libera o mapeamento (visões derivadas deixam de ser válidas)."""
+        liberar_mapa(self.dados)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
 # conversões texto <-> inteiro
 
 def texto_para_inteiro(texto: str) -> tuple[int, int]:
@@ -104,6 +314,13 @@ __all__ = [
     "escrever_bytes",
     "ler_texto",
     "escrever_texto",
+    "iterar_texto",
+    "EscritorTexto",
+    "escrever_texto_em_blocos",
+    "mapear_bytes",
+    "liberar_mapa",
+    "bytes_mapeados",
+    "TextoMapeado",
     "texto_para_inteiro",
     "inteiro_para_texto",
 ]
\ No newline at end of file
@@ -4,24 +4,17 @@ Pacote analise_de_frequencia
 Funções e perfis linguísticos para análise de frequência
 """
 
-from .util_frequencia import (
-    contar_frequencias,
-    frequencia_relativa,
-    caracteres_mais_frequentes,
-)
-from .perfis_linguisticos import (
-    FREQ_PT,
-    FREQ_EN,
-)
-from .similaridade import (
-    score_chi_quadrado,
-)
+from crypto_io._importacao import exportar_sob_demanda
 
-__all__ = [
-    "contar_frequencias",
-    "frequencia_relativa",
-    "caracteres_mais_frequentes",
-    "FREQ_PT",
-    "FREQ_EN",
-    "score_chi_quadrado",
-]
\ No newline at end of file
+_EXPORTACOES = {
+    "contar_frequencias": ".util_frequencia",
+    "frequencia_relativa": ".util_frequencia",
+    "caracteres_mais_frequentes": ".util_frequencia",
+    "FREQ_PT": ".perfis_linguisticos",
+    "FREQ_EN": ".perfis_linguisticos",
+    "score_chi_quadrado": ".similaridade",
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportar_sob_demanda(__name__, globals(), _EXPORTACOES)
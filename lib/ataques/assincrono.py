@@ -0,0 +1,95 @@
+"""
+Orquestração assíncrona dos ataques (César, Vigenère e Franklin–Reiter).
+
+Os ataques são CPU-bound, então rodam num ProcessPoolExecutor; um
+semáforo limita quantos ataques ficam em execução ao mesmo tempo.
+Cancelar a tarefa que aguarda um ataque (ou estourar o timeout) remove o
+trabalho da fila do pool se ele ainda não começou; se já começou, o
+processo não pode ser interrompido: o resultado é descartado, mas a vaga
+do semáforo só é devolvida quando o trabalho de fato termina, para que
+ataques abandonados não se acumulem além de max_simultaneos.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional
+import asyncio
+import os
+
+from lib.ataques.cifra_de_Cesar.ataque import ataque_cesar
+from lib.ataques.cifra_de_vigenere.ataque import atacar as atacar_vigenere
+from lib.ataques.rsa_franklin_reiter.ataque import ataque_franklin_reiter
+
+
+class OrquestradorAtaques:
+    """
+    Executa ataques num pool de processos sem bloquear o event loop.
+
+    Args:
+        max_processos: tamanho do pool (padrão: número de CPUs).
+        max_simultaneos: ataques em execução ao mesmo tempo; os demais
+            aguardam no semáforo (padrão: max_processos).
+    """
+
+    def __init__(self, max_processos: Optional[int] = None, max_simultaneos: Optional[int] = None):
+        self.max_processos = max_processos or os.cpu_count() or 1
+        self.max_simultaneos = max_simultaneos or self.max_processos
+        self._semaforo = asyncio.Semaphore(self.max_simultaneos)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _obter_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_processos)
+        return self._executor
+
+    async def executar(self, func, *args, timeout: Optional[float] = None, **kwargs):
+        """
+        Executa func(*args, **kwargs) num processo do pool.
+        Lança asyncio.TimeoutError se passar de timeout segundos.
+
+        A vaga do semáforo é liberada por um callback do futuro do pool,
+        quando o trabalho termina (ou é cancelado antes de começar), e não
+        quando esta corrotina desiste de esperar.
+        """
+        await self._semaforo.acquire()
+        try:
+            futuro = self._obter_executor().submit(partial(func, *args, **kwargs))
+        except BaseException:
+            self._semaforo.release()
+            raise
+        loop = asyncio.get_running_loop()
+
+        def devolver_vaga(_):
+            # roda na thread do pool: devolve a vaga pelo event loop, que
+            # pode já ter sido fechado se o trabalho foi abandonado
+            if loop.is_closed():
+                return
+            try:
+                loop.call_soon_threadsafe(self._semaforo.release)
+            except RuntimeError:
+                pass  # fechado entre a verificação e a chamada
+
+        futuro.add_done_callback(devolver_vaga)
+        return await asyncio.wait_for(asyncio.wrap_future(futuro), timeout)
+
+    async def ataque_cesar(self, texto_cifrado: str, timeout: Optional[float] = None) -> dict:
+        return await self.executar(ataque_cesar, texto_cifrado, timeout=timeout)
+
+    async def ataque_vigenere(self, texto_cifrado: str, timeout: Optional[float] = None) -> str:
+        return await self.executar(atacar_vigenere, texto_cifrado, timeout=timeout)
+
+    async def ataque_franklin_reiter(self, c1, c2, e, n, a, b, nbytes=None, d: Optional[int] = None,
+                                     timeout: Optional[float] = None):
+        return await self.executar(ataque_franklin_reiter, c1, c2, e, n, a, b, nbytes, d, timeout=timeout)
+
+    def fechar(self) -> None:
+        """Encerra o pool, cancelando trabalhos que ainda não começaram."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.fechar()
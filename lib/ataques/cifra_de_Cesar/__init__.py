@@ -4,32 +4,20 @@ Pacote cifra_de_Cesar
 Funções para ataque de Cifra de César.
 """
 
-from .ataque import (
-    ataque_cesar,
-)
+from crypto_io._importacao import exportar_sob_demanda
 
-from .cipher import (
-    is_alpha_char,
-    normalizar_chave,
-    cifrar,
-    decifrar,
-)
+_EXPORTACOES = {
+    "ataque_cesar": ".ataque",
+    "is_alpha_char": ".cipher",
+    "normalizar_chave": ".cipher",
+    "cifrar": ".cipher",
+    "decifrar": ".cipher",
+    "ler_arquivo_texto": ".cli",
+    "montar_parser": ".cli",
+    "imprimir_resultados": ".cli",
+    "main": ".cli",
+}
 
-from .cli import (
-    ler_arquivo_texto,
-    montar_parser,
-    imprimir_resultados,
-    main,
-)
+__all__ = list(_EXPORTACOES)
 
-__all__ = [
-    "ataque_cesar",
-    "is_alpha_char",
-    "normalizar_chave",
-    "cifrar",
-    "decifrar",
-    "ler_arquivo_texto",
-    "montar_parser",
-    "imprimir_resultados",
-    "main",
-]
\ No newline at end of file
+__getattr__, __dir__ = exportar_sob_demanda(__name__, globals(), _EXPORTACOES)
@@ -1,6 +1,9 @@
 import argparse
+import sys
 from typing import Optional, Dict
 
+from crypto_io import ler_texto
+
 from .cipher import (
     cifrar,
     decifrar,
@@ -12,8 +15,7 @@ def ler_arquivo_texto(caminho: str) -> str:
     Lê o conteúdo de um arquivo de texto codificado em UTF-8.
     """
     try:
-        with open(caminho, "r", encoding="utf-8") as f:
-            return f.read()
+        return ler_texto(caminho)
     except FileNotFoundError:
         print(f"Erro: arquivo '{caminho}' não encontrado.")
         sys.exit(1)
@@ -4,70 +4,71 @@ Pacote rsa_franklin_reiter
 Funções para ataque de Franklin-Reiter em RSA.
 """
 
-from .aritmetica_modular import (
-    egcd,
-    modinv,
-    is_probable_prime,
-)
+from crypto_io._importacao import exportar_sob_demanda
 
-from .ataque import (
-    ataque_franklin_reiter,
-)
+_EXPORTACOES = {
+    "ataque_franklin_reiter": ".ataque",
+    "ataque_franklin_reiter_lote": ".ataque",
+    "egcd": ".aritmetica_modular",
+    "modinv": ".aritmetica_modular",
+    "modinv_lote": ".aritmetica_modular",
+    "is_probable_prime": ".aritmetica_modular",
+    "ContextoModular": ".aritmetica_modular",
+    "contexto_para": ".aritmetica_modular",
+    "reciproco": ".aritmetica_modular",
+    "backend_atual": ".backend_inteiros",
+    "definir_backend": ".backend_inteiros",
+    "usando_backend": ".backend_inteiros",
+    "gmpy2_disponivel": ".backend_inteiros",
+    "definir_pool_chaves": ".gerador_casos",
+    "gerar_chaves": ".gerador_casos",
+    "gerar_mensagens_relacionadas": ".gerador_casos",
+    "gerar_caso_textos": ".gerador_casos",
+    "gerar_caso_m1": ".gerador_casos",
+    "gerar_caso_aleatorio": ".gerador_casos",
+    "gerador_caso_relacionado_linear": ".gerador_casos",
+    "gerar_casos_em_lote": ".lote_casos",
+    "gerar_bloco_de_casos": ".lote_casos",
+    "iterar_casos": ".lote_casos",
+    "expandir_relacao_linear": ".mensagens_relacionadas",
+    "construir_polinomio_para_cifra": ".mensagens_relacionadas",
+    "construir_polinomio_de_relacao": ".mensagens_relacionadas",
+    "tentativa_de_recuperacao_de_mensagem": ".mensagens_relacionadas",
+    "raiz_de_polinomio_linear": ".mensagens_relacionadas",
+    "recuperar_mensagens_em_lote": ".mensagens_relacionadas",
+    "recuperar_mensagem_forma_fechada": ".mensagens_relacionadas",
+    "limpar_cache_expansao": ".mensagens_relacionadas",
+    "FatorEncontrado": ".polynomial",
+    "PolinomioModN": ".polynomial",
+    "poly_normalize": ".polynomial",
+    "poly_add": ".polynomial",
+    "poly_mul": ".polynomial",
+    "poly_eval": ".polynomial",
+    "poly_gcd": ".polynomial",
+    "poly_divmod": ".polynomial",
+    "generate_prime": ".util_rsa",
+    "mdc_em_lote": ".mdc_lote",
+    "fatorar_modulos_compartilhados": ".mdc_lote",
+    "ler_modulos": ".mdc_lote",
+    "PoolChaves": ".pool_chaves",
+    "gerar_chaves_paralelo": ".pool_chaves",
+    "gerar_chave_completa": ".pool_chaves",
+    "generate_rsa_keypair": ".util_rsa",
+    "build_rsa_keypair": ".util_rsa",
+    "rsa_encrypt": ".util_rsa",
+    "rsa_decrypt": ".util_rsa",
+    "CRTPrivateKey": ".util_rsa",
+    "rsa_encrypt_batch": ".util_rsa",
+    "rsa_decrypt_batch": ".util_rsa",
+    "cifrar_em_blocos": ".cifra_em_blocos",
+    "decifrar_em_blocos": ".cifra_em_blocos",
+    "iterar_cifrado": ".cifra_em_blocos",
+    "iterar_decifrado": ".cifra_em_blocos",
+    "cifrar_arquivo_em_blocos": ".cifra_em_blocos",
+    "decifrar_arquivo_em_blocos": ".cifra_em_blocos",
+    "algoritmo_rsa_em_blocos": ".cifra_em_blocos",
+}
 
-from .gerador_casos import (
-    gerar_chaves,
-    gerar_mensagens_relacionadas,
-    gerar_caso_textos,
-    gerar_caso_m1,
-    gerar_caso_aleatorio,
-    gerador_caso_relacionado_linear,
-)
+__all__ = list(_EXPORTACOES)
 
-from .mensagens_relacionadas import (
-    expandir_relacao_linear,
-    construir_polinomio_para_cifra,
-    construir_polinomio_de_relacao,
-    tentativa_de_recuperacao_de_mensagem,
-)
-
-from .polynomial import (
-    poly_normalize,
-    poly_add,
-    poly_mul,
-    poly_eval,
-    poly_gcd,
-    poly_divmod,
-)
-
-from .util_rsa import (
-    generate_prime,
-    generate_rsa_keypair,
-    rsa_encrypt,
-    rsa_decrypt,
-)
-
-__all__ = [
-    "egcd",
-    "modinv",
-    "is_probable_prime",
-    "gerar_chaves",
-    "gerar_mensagens_relacionadas",
-    "gerar_caso_textos",
-    "gerar_caso_m1",
-    "gerar_caso_aleatorio",
-    "gerador_caso_relacionado_linear",
-    "expandir_relacao_linear",
-    "construir_polinomio_para_cifra",
-    "construir_polinomio_de_relacao",
-    "tentativa_de_recuperacao_de_mensagem",
-    "poly_normalize",
-    "poly_add",
-    "poly_mul",
-    "poly_eval",
-    "poly_gcd",
-    "poly_divmod",
-    "generate_prime",
-    "generate_rsa_keypair",
-    "rsa_encrypt",
-    "rsa_decrypt",
-]
\ No newline at end of file
+__getattr__, __dir__ = exportar_sob_demanda(__name__, globals(), _EXPORTACOES)
@@ -1,11 +1,14 @@
 from .mensagens_relacionadas import (
-    construir_polinomio_de_relacao,
     tentativa_de_recuperacao_de_mensagem,
+    recuperar_mensagens_em_lote,
 )
-from typing import Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
+from time import perf_counter
+from typing import Iterable, Iterator, Optional
+import os
 
 from crypto_io.util_io import inteiro_para_texto
-from .polynomial import poly_gcd
 
 
 def ataque_franklin_reiter(c1, c2, e, n, a, b, nbytes=None, d: Optional[int] = None):
@@ -13,14 +16,8 @@ def ataque_franklin_reiter(c1, c2, e, n, a, b, nbytes=None, d: Optional[int] = N
     Executa o ataque Franklin–Reiter para m2 = a*m1 + b (mod n).
     Retorna o inteiro m1 e, SE nbytes for passado, retorna o texto também.
     """
-    
-    # f1(x) = x^e - c1 (mod n)
-    f1_coefs = construir_polinomio_de_relacao(a=1, b=0, e=e, c=c1, n=n)
 
-    # f2(x) = (a*x + b)^e - c2 (mod n)
-    f2_coefs = construir_polinomio_de_relacao(a=a, b=b, e=e, c=c2, n=n)
-
-    polinomio_mdc = poly_gcd(f1_coefs, f2_coefs, n)
+    # gcd de f1(x) = x^e - c1 e f2(x) = (a*x + b)^e - c2 (mod n)
     m1 = tentativa_de_recuperacao_de_mensagem(c1, c2, a, b, e, n)
 
     # Se tentativa falhar e chave privada (d) for fornecida, usamos d como fallback
@@ -45,4 +42,73 @@ def ataque_franklin_reiter(c1, c2, e, n, a, b, nbytes=None, d: Optional[int] = N
         texto = inteiro_para_texto(m1_int, tamanho_m1)
         return m1_int, texto
 
-    return m1_int
\ No newline at end of file
+    return m1_int
+
+
+def _iterar_ataques(pares, e, n, a, b, nbytes=None) -> Iterator[tuple[int | None, str | None, float]]:
+    """
+    Ataca os pares no processo atual, gerando cada resultado assim que sai.
+    O tempo do primeiro par inclui a expansão de (a*x + b)^e, que fica em
+    cache para os seguintes. Um m1 que não cabe em nbytes ou não é UTF-8
+    válido sai com texto None, sem interromper o lote.
+    """
+    tamanho = None
+    if nbytes is not None:
+        tamanho = nbytes if isinstance(nbytes, int) else nbytes[0]
+
+    inicio = perf_counter()
+    for m1 in recuperar_mensagens_em_lote(pares, a, b, e, n):
+        texto = None
+        if m1 is not None and tamanho is not None:
+            try:
+                texto = inteiro_para_texto(m1, tamanho)
+            except (OverflowError, UnicodeDecodeError):
+                texto = None
+        fim = perf_counter()
+        yield m1, texto, fim - inicio
+        inicio = perf_counter()
+
+
+def _atacar_fatia(pares, e, n, a, b, nbytes=None) -> list[tuple[int | None, str | None, float]]:
+    return list(_iterar_ataques(pares, e, n, a, b, nbytes))
+
+
+def ataque_franklin_reiter_lote(pares: Iterable[tuple[int, int]], e, n, a, b, nbytes=None,
+                                processes: int | None = None, executor: Executor | None = None,
+                                tamanho_fatia: int | None = None
+                                ) -> Iterator[tuple[int | None, str | None, float]]:
+    """
+    Franklin–Reiter para vários pares (c1, c2) que compartilham n, e e a
+    relação m2 = a*m1 + b (mod n).
+
+    Gera (m1, texto, segundos) para cada par, na ordem de entrada; m1 e
+    texto são None quando o par não é recuperado (sem lançar exceção,
+    para não interromper o lote). texto só é preenchido se nbytes for passado.
+
+    Sem processes/executor tudo roda no processo atual, um par por vez.
+    Com processes > 1 (ou um executor), os pares são divididos em fatias
+    de tamanho_fatia e distribuídos no pool; cada processo monta as partes
+    de f1 e f2 que não dependem das cifras uma única vez. Junto com um
+    executor, processes é o número de processos dele (padrão:
+    os.cpu_count()), usado só para dimensionar as fatias.
+    """
+    if executor is None and (processes is None or processes <= 1):
+        yield from _iterar_ataques(pares, e, n, a, b, nbytes)
+        return
+
+    pares = list(pares)
+    proprio = executor is None
+    if proprio:
+        executor = ProcessPoolExecutor(max_workers=processes)
+    try:
+        if tamanho_fatia is None:
+            partes = (processes or os.cpu_count() or 1) * 4
+            tamanho_fatia = max(1, -(-len(pares) // partes))
+        fatias = [pares[i:i + tamanho_fatia] for i in range(0, len(pares), tamanho_fatia)]
+        for parte in executor.map(_atacar_fatia, fatias, repeat(e), repeat(n), repeat(a), repeat(b),
+                                  repeat(nbytes)):
+            yield from parte
+    finally:
+        if proprio:
+            executor.shutdown(cancel_futures=True)
+
@@ -0,0 +1,100 @@
+"""
+Escolha do backend de inteiros grandes.
+
+Se o gmpy2 estiver instalado ele é usado por padrão nas exponenciações,
+inversões, pré-testes de primalidade e nos laços de coeficientes dos
+polinômios; sem ele tudo roda com int do Python. O backend pode ser
+forçado com definir_backend() / usando_backend() ou pela variável de
+ambiente CRIPTOATAQUES_BACKEND ("python" ou "gmpy2"), útil para comparar
+desempenho. As funções públicas do pacote devolvem sempre int, com o
+mesmo resultado nos dois backends.
+"""
+
+from contextlib import contextmanager
+import os
+
+try:
+    import gmpy2
+except ImportError:  # dependência opcional
+    gmpy2 = None
+
+PYTHON = "python"
+GMPY2 = "gmpy2"
+BACKENDS = (PYTHON, GMPY2)
+VARIAVEL_AMBIENTE = "CRIPTOATAQUES_BACKEND"
+
+
+def gmpy2_disponivel() -> bool:
+    return gmpy2 is not None
+
+
+def _validar(nome: str | None) -> str:
+    if nome is None:
+        return GMPY2 if gmpy2 is not None else PYTHON
+    if nome not in BACKENDS:
+        raise ValueError(f"Backend desconhecido: {nome!r} (use um de {BACKENDS}).")
+    if nome == GMPY2 and gmpy2 is None:
+        raise ImportError("O backend 'gmpy2' foi pedido, mas o gmpy2 não está instalado.")
+    return nome
+
+
+_atual = _validar(os.environ.get(VARIAVEL_AMBIENTE) or None)
+
+
+def backend_atual() -> str:
+    return _atual
+
+
+def usando_gmpy2() -> bool:
+    return _atual == GMPY2
+
+
+def definir_backend(nome: str | None = None) -> str:
+    """
+    Troca o backend ("python", "gmpy2" ou None para detectar).
+    Retorna o backend anterior. Processos já criados num pool não são
+    afetados; para eles use a variável de ambiente.
+    """
+    global _atual
+    anterior = _atual
+    _atual = _validar(nome)
+    return anterior
+
+
+@contextmanager
+def usando_backend(nome: str | None):
+    """Usa o backend `nome` dentro do bloco with e depois restaura o anterior."""
+    anterior = definir_backend(nome)
+    try:
+        yield
+    finally:
+        definir_backend(anterior)
+
+
+def nativo(x: int):
+    """x no tipo do backend atual (mpz com gmpy2, int sem)."""
+    return gmpy2.mpz(x) if _atual == GMPY2 else x
+
+
+def potencia(base: int, expoente: int, n: int) -> int:
+    """pow(base, expoente, n) como int."""
+    if _atual == GMPY2:
+        return int(gmpy2.powmod(base, expoente, n))
+    return pow(base, expoente, n)
+
+
+def inverso(a: int, n: int) -> int:
+    """Inverso de a mod n como int; lança ValueError se não existir."""
+    if _atual == GMPY2:
+        try:
+            return int(gmpy2.invert(a, n))
+        except ZeroDivisionError:
+            raise ValueError(f"Inverso modular não existe para a={a}, n={n}") from None
+    return pow(a, -1, n)
+
+
+def multiplicar(a: int, b: int) -> int:
+    """Produto de dois inteiros grandes como int (GMP usa FFT para os enormes)."""
+    if _atual == GMPY2:
+        return int(gmpy2.mpz(a) * gmpy2.mpz(b))
+    return a * b
@@ -0,0 +1,283 @@
+"""
+Benchmark do ataque Franklin–Reiter por etapa, expoente e tamanho de chave.
+
+Para cada (e, bits do módulo) da grade, gera um caso reproduzível (a partir
+da semente, sem rede) e mede separadamente:
+
+- expansao: montagem de f1 = x^e - c1 e f2 = (a*x + b)^e - c2 (mod n)
+- mdc: poly_gcd(f1, f2, n)
+- raiz: raiz do gcd linear
+- forma_fechada: recuperar_mensagem_forma_fechada (só e = 3, 5 e 7)
+- ataque: ataque_franklin_reiter de ponta a ponta
+
+Cada etapa roda algumas vezes sem medir (aquecimento) e depois
+`repeticoes` vezes; os caches de expansão são limpos antes de cada
+execução. O resultado é um JSON que pode servir de referência para
+execuções futuras:
+
+    python -m lib.ataques.rsa_franklin_reiter.benchmark -e 3 17 -b 512 1024 \\
+        --saida atual.json --referencia referencia.json --tolerancia 0.25
+
+A grade padrão (e até 257, módulos até 4096 bits) roda em menos de dois
+minutos num único núcleo; e = 65537 pode ser pedido com -e, mas só é
+viável com gmpy2.
+
+O código de saída é 1 quando alguma etapa fica mais lenta que a
+referência além da tolerância ou algum m1 sai incorreto, e 2 quando a
+referência foi medida em outro ambiente (backend, versão ou implementação
+do Python); --ignorar-ambiente compara mesmo assim, com um aviso.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from . import backend_inteiros as backend
+from .ataque import ataque_franklin_reiter
+from .lote_casos import gerar_bloco_de_casos
+from .mensagens_relacionadas import (
+    FORMULAS_FECHADAS,
+    construir_polinomio_de_relacao,
+    limpar_cache_expansao,
+    raiz_de_polinomio_linear,
+    recuperar_mensagem_forma_fechada,
+)
+from .polynomial import FatorEncontrado, poly_gcd
+
+# 65537 fica fora da grade padrão: sem gmpy2, o mdc de grau 65537 não
+# termina em tempo útil (ver o comentário do half-GCD em polynomial.py)
+EXPOENTES = (3, 5, 17, 257)
+TAMANHOS = (512, 1024, 2048, 3072, 4096)
+ETAPAS = ("expansao", "mdc", "raiz", "forma_fechada", "ataque")
+VERSAO_FORMATO = 1
+# campos do relatório que precisam coincidir para os tempos serem comparáveis
+CAMPOS_AMBIENTE = ("backend", "python", "implementacao")
+
+
+def medir(funcao: Callable[[], object], repeticoes: int = 5, aquecimento: int = 1,
+          preparar: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """
+    Tempos de funcao() em segundos: mínimo, mediana e média de
+    `repeticoes` execuções, depois de `aquecimento` execuções descartadas.
+    preparar() roda antes de cada execução, fora do tempo medido.
+    """
+    if repeticoes < 1:
+        raise ValueError("repeticoes deve ser >= 1.")
+    for _ in range(aquecimento):
+        if preparar is not None:
+            preparar()
+        funcao()
+    tempos = []
+    for _ in range(repeticoes):
+        if preparar is not None:
+            preparar()
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return {
+        "min": min(tempos),
+        "mediana": statistics.median(tempos),
+        "media": statistics.fmean(tempos),
+        "repeticoes": repeticoes,
+    }
+
+
+def gerar_caso(bits: int, e: int, semente: int = 0) -> dict:
+    """Caso reproduzível com módulo de `bits` bits (dois primos de bits/2)."""
+    return gerar_bloco_de_casos(bits // 2, e, "aleatorio", semente, 0, 0, 1)[0]
+
+
+def medir_caso(caso: dict, repeticoes: int = 5, aquecimento: int = 1) -> dict:
+    """Mede todas as etapas para um caso gerado por gerar_caso."""
+    n, e, a, b = caso["n"], caso["e"], caso["a"], caso["b"]
+    c1, c2 = caso["c1"], caso["c2"]
+
+    def expansao():
+        return (construir_polinomio_de_relacao(1, 0, e, c1, n),
+                construir_polinomio_de_relacao(a, b, e, c2, n))
+
+    f1, f2 = expansao()
+
+    def mdc():
+        try:
+            return poly_gcd(f1, f2, n)
+        except FatorEncontrado:
+            return None
+
+    g = mdc()
+    etapas = {
+        "expansao": medir(expansao, repeticoes, aquecimento, limpar_cache_expansao),
+        "mdc": medir(mdc, repeticoes, aquecimento),
+    }
+    m1 = raiz_de_polinomio_linear(g, n) if g is not None else None
+    if g is not None:
+        etapas["raiz"] = medir(lambda: raiz_de_polinomio_linear(g, n), repeticoes, aquecimento)
+    if e in FORMULAS_FECHADAS:
+        etapas["forma_fechada"] = medir(lambda: recuperar_mensagem_forma_fechada(c1, c2, a, b, e, n),
+                                        repeticoes, aquecimento)
+    etapas["ataque"] = medir(lambda: ataque_franklin_reiter(c1, c2, e, n, a, b),
+                             repeticoes, aquecimento, limpar_cache_expansao)
+
+    return {
+        "bits": 2 * caso["bits"],
+        "e": e,
+        "correto": m1 == caso["m1"],
+        "etapas": etapas,
+    }
+
+
+def executar_benchmark(expoentes: Iterable[int] = EXPOENTES, tamanhos: Iterable[int] = TAMANHOS,
+                       repeticoes: int = 5, aquecimento: int = 1, semente: int = 0,
+                       progresso: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    Roda a grade expoentes x tamanhos e devolve o relatório (dict
+    serializável em JSON). progresso(resultado) é chamado após cada caso.
+    """
+    resultados = []
+    for bits in tamanhos:
+        for e in expoentes:
+            resultado = medir_caso(gerar_caso(bits, e, semente), repeticoes, aquecimento)
+            resultados.append(resultado)
+            if progresso is not None:
+                progresso(resultado)
+    return {
+        "versao": VERSAO_FORMATO,
+        "python": platform.python_version(),
+        "implementacao": platform.python_implementation(),
+        "backend": backend.backend_atual(),
+        "semente": semente,
+        "repeticoes": repeticoes,
+        "aquecimento": aquecimento,
+        "resultados": resultados,
+    }
+
+
+def diferencas_de_ambiente(atual: dict, referencia: dict) -> List[str]:
+    """Campos de CAMPOS_AMBIENTE presentes nos dois relatórios e com valores diferentes."""
+    return [f"{campo}: {referencia[campo]} -> {atual[campo]}" for campo in CAMPOS_AMBIENTE
+            if campo in atual and campo in referencia and atual[campo] != referencia[campo]]
+
+
+def comparar_com_referencia(atual: dict, referencia: dict, tolerancia: float = 0.25,
+                            ignorar_ambiente: bool = False) -> List[dict]:
+    """
+    Compara as medianas de cada (bits, e, etapa) presente nos dois
+    relatórios. Devolve as regressões: etapas em que atual > referência
+    * (1 + tolerancia), com a razão atual / referência (motivo "lento"),
+    e casos do relatório atual com m1 incorreto (motivo "incorreto").
+
+    Lança ValueError se os relatórios vierem de ambientes diferentes
+    (ver diferencas_de_ambiente), a menos que ignorar_ambiente seja True.
+    """
+    diferencas = diferencas_de_ambiente(atual, referencia)
+    if diferencas and not ignorar_ambiente:
+        raise ValueError("Referência medida em outro ambiente (" + "; ".join(diferencas) + ").")
+
+    anteriores = {(r["bits"], r["e"]): r["etapas"] for r in referencia.get("resultados", [])}
+    regressoes = []
+    for resultado in atual["resultados"]:
+        if not resultado["correto"]:
+            regressoes.append({"bits": resultado["bits"], "e": resultado["e"], "etapa": None,
+                               "motivo": "incorreto"})
+        etapas_ref = anteriores.get((resultado["bits"], resultado["e"]))
+        if etapas_ref is None:
+            continue
+        for etapa, tempos in resultado["etapas"].items():
+            if etapa not in etapas_ref:
+                continue
+            antes, agora = etapas_ref[etapa]["mediana"], tempos["mediana"]
+            if agora > antes * (1 + tolerancia):
+                regressoes.append({
+                    "bits": resultado["bits"], "e": resultado["e"], "etapa": etapa, "motivo": "lento",
+                    "referencia": antes, "atual": agora,
+                    "razao": agora / antes if antes > 0 else float("inf"),
+                })
+    return regressoes
+
+
+def salvar_relatorio(relatorio: dict, caminho: str) -> None:
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(relatorio, f, indent=2)
+        f.write("\n")
+
+
+def carregar_relatorio(caminho: str) -> dict:
+    with open(caminho, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _imprimir_resultado(resultado: dict) -> None:
+    tempos = "  ".join(f"{etapa}={t['mediana'] * 1000:.3f}ms" for etapa, t in resultado["etapas"].items())
+    aviso = "" if resultado["correto"] else "  [m1 INCORRETO]"
+    print(f"bits={resultado['bits']:<5} e={resultado['e']:<6} {tempos}{aviso}")
+
+
+def montar_parser() -> argparse.ArgumentParser:
+    """
+    Cria e configura o analisador de argumentos do benchmark.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark do ataque Franklin–Reiter por etapa."
+    )
+    parser.add_argument("-e", "--expoentes", type=int, nargs="+", default=list(EXPOENTES),
+                        help=f"Expoentes públicos. Padrão: {' '.join(map(str, EXPOENTES))}")
+    parser.add_argument("-b", "--bits", type=int, nargs="+", default=list(TAMANHOS),
+                        help=f"Tamanhos do módulo em bits. Padrão: {' '.join(map(str, TAMANHOS))}")
+    parser.add_argument("-r", "--repeticoes", type=int, default=5,
+                        help="Execuções medidas por etapa. Padrão: 5")
+    parser.add_argument("-w", "--aquecimento", type=int, default=1,
+                        help="Execuções descartadas antes de medir. Padrão: 1")
+    parser.add_argument("-s", "--semente", type=int, default=0,
+                        help="Semente dos casos gerados. Padrão: 0")
+    parser.add_argument("-o", "--saida", type=str,
+                        help="Arquivo JSON onde gravar os resultados.")
+    parser.add_argument("--referencia", type=str,
+                        help="Arquivo JSON de uma execução anterior para comparar.")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="Folga relativa antes de acusar regressão. Padrão: 0.25")
+    parser.add_argument("--ignorar-ambiente", action="store_true",
+                        help="Compara mesmo com backend ou Python diferentes da referência.")
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Executa o benchmark pela linha de comando. Retorna 1 se houver
+    regressões em relação à referência, 2 se a referência for de outro
+    ambiente e 0 caso contrário.
+    """
+    args = montar_parser().parse_args(argv)
+    relatorio = executar_benchmark(args.expoentes, args.bits, args.repeticoes,
+                                   args.aquecimento, args.semente, _imprimir_resultado)
+    if args.saida:
+        salvar_relatorio(relatorio, args.saida)
+
+    if not args.referencia:
+        return 0
+    referencia = carregar_relatorio(args.referencia)
+    diferencas = diferencas_de_ambiente(relatorio, referencia)
+    if diferencas and not args.ignorar_ambiente:
+        print("ERRO: referência medida em outro ambiente (" + "; ".join(diferencas) + "); "
+              "use --ignorar-ambiente para comparar mesmo assim.", file=sys.stderr)
+        return 2
+    for diferenca in diferencas:
+        print(f"AVISO: ambiente diferente da referência, {diferenca}")
+
+    regressoes = comparar_com_referencia(relatorio, referencia, args.tolerancia, ignorar_ambiente=True)
+    for r in regressoes:
+        if r["motivo"] == "incorreto":
+            print(f"REGRESSÃO bits={r['bits']} e={r['e']}: m1 INCORRETO")
+            continue
+        print(f"REGRESSÃO bits={r['bits']} e={r['e']} {r['etapa']}: "
+              f"{r['referencia'] * 1000:.3f}ms -> {r['atual'] * 1000:.3f}ms ({r['razao']:.2f}x)")
+    if not regressoes:
+        print(f"Sem regressões (tolerância {args.tolerancia:.0%}).")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Cifragem RSA de textos e arquivos longos em blocos do tamanho do módulo.
+
+rsa_encrypt aceita um único inteiro menor que n; aqui os bytes são
+divididos com crypto_io.blocos_rsa em blocos de tamanho_bloco_para_modulo(n)
+bytes, cifrados em lotes com rsa_encrypt_batch (em paralelo com
+processes > 1) e gravados num contêiner binário:
+
+    cabeçalho: MAGICO, bytes por bloco cifrado, bytes por bloco claro,
+               tamanho total do texto claro (big-endian, ver CABECALHO)
+    corpo:     um bloco cifrado de largura fixa após o outro
+
+A largura fixa permite decifrar em fluxo, lote a lote, sem índice.
+(RSA "de livro", sem preenchimento: serve para medir e comparar, não para
+proteger dados.)
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import BinaryIO, Callable, Dict, Generator, Iterator, Optional, Tuple, Union
+import base64
+import io
+import os
+import struct
+
+from crypto_io.blocos_rsa import BlocosInteiros, tamanho_bloco_para_modulo
+from crypto_io.util_io import BytesLike, bytes_mapeados
+from .util_rsa import CRTPrivateKey, rsa_decrypt_batch, rsa_encrypt_batch
+
+MAGICO = b"RSABLOC1"
+CABECALHO = struct.Struct(">8sIIQ")
+# blocos por chamada de rsa_encrypt_batch / rsa_decrypt_batch
+TAMANHO_LOTE = 256
+
+ChavePrivada = Union[Tuple[int, int, int], CRTPrivateKey]
+
+
+def _abrir_pool(processes: Optional[int], executor: Optional[Executor]):
+    """Um único pool para todos os lotes (rsa_*_batch criaria um por chamada)."""
+    if executor is None and processes is not None and processes > 1:
+        return ProcessPoolExecutor(max_workers=processes), True
+    return executor, False
+
+
+def iterar_cifrado(dados: Union[str, BytesLike], chave_publica: Tuple[int, int],
+                   processes: Optional[int] = None, executor: Optional[Executor] = None,
+                   tamanho_lote: int = TAMANHO_LOTE) -> Iterator[bytes]:
+    """
+    Gera o contêiner cifrado aos pedaços: primeiro o cabeçalho, depois os
+    blocos cifrados de cada lote. Texto é codificado em UTF-8.
+    """
+    if isinstance(dados, str):
+        dados = dados.encode("utf-8")
+    if tamanho_lote <= 0:
+        raise ValueError("tamanho_lote deve ser positivo.")
+    e, n = chave_publica
+    largura = (n.bit_length() + 7) // 8
+    blocos = BlocosInteiros(dados, tamanho_bloco_para_modulo(n))
+
+    yield CABECALHO.pack(MAGICO, largura, blocos.tamanho_bloco, blocos.tamanho_total)
+    executor, proprio = _abrir_pool(processes, executor)
+    try:
+        for lote in blocos.lotes(tamanho_lote):
+            cifras = rsa_encrypt_batch(lote, (e, n), processes=processes, executor=executor)
+            yield b"".join(c.to_bytes(largura, "big") for c in cifras)
+    finally:
+        if proprio:
+            executor.shutdown(cancel_futures=True)
+
+
+def cifrar_em_blocos(dados: Union[str, BytesLike], chave_publica: Tuple[int, int],
+                     processes: Optional[int] = None, executor: Optional[Executor] = None,
+                     tamanho_lote: int = TAMANHO_LOTE) -> bytes:
+    """Cifra um texto (ou bytes) de qualquer tamanho e devolve o contêiner."""
+    return b"".join(iterar_cifrado(dados, chave_publica, processes, executor, tamanho_lote))
+
+
+def cifrar_arquivo_em_blocos(origem: str, destino: str, chave_publica: Tuple[int, int],
+                             processes: Optional[int] = None, executor: Optional[Executor] = None,
+                             tamanho_lote: int = TAMANHO_LOTE) -> int:
+    """
+    Cifra o arquivo origem (mapeado em memória, lido sob demanda) e grava o
+    contêiner em destino à medida que os lotes ficam prontos.
+    Retorna o número de bytes gravados.
+    """
+    with bytes_mapeados(origem) as dados:
+        return _gravar(destino, iterar_cifrado(dados, chave_publica, processes, executor, tamanho_lote))
+
+
+def _gravar(destino: str, pedacos: Generator[bytes, None, None]) -> int:
+    """
+    Grava os pedaços em destino + ".tmp" e só no fim o move para destino.
+    O gerador é sempre fechado, para soltar as visões da origem mapeada
+    antes que bytes_mapeados feche o mmap.
+    """
+    total = 0
+    tmp = destino + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            for pedaco in pedacos:
+                f.write(pedaco)
+                total += len(pedaco)
+        os.replace(tmp, destino)
+    finally:
+        pedacos.close()
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return total
+
+
+def _ler_exato(f: BinaryIO, tamanho: int) -> bytes:
+    dados = f.read(tamanho)
+    if len(dados) != tamanho:
+        raise ValueError("Contêiner RSA truncado.")
+    return dados
+
+
+def iterar_decifrado(fonte: Union[BytesLike, BinaryIO], chave_privada: ChavePrivada,
+                     processes: Optional[int] = None, executor: Optional[Executor] = None,
+                     tamanho_lote: int = TAMANHO_LOTE) -> Iterator[bytes]:
+    """
+    Decifra um contêiner (bytes ou arquivo binário aberto) lote a lote,
+    gerando os bytes do texto claro sem carregar o contêiner inteiro.
+    """
+    if tamanho_lote <= 0:
+        raise ValueError("tamanho_lote deve ser positivo.")
+    f = io.BytesIO(fonte) if isinstance(fonte, (bytes, bytearray, memoryview)) else fonte
+    magico, largura, tamanho_bloco, restante = CABECALHO.unpack(_ler_exato(f, CABECALHO.size))
+    if magico != MAGICO:
+        raise ValueError("Não é um contêiner RSA em blocos.")
+    chave = CRTPrivateKey.from_private_key(chave_privada)
+    if largura != (chave.N.bit_length() + 7) // 8 or tamanho_bloco != tamanho_bloco_para_modulo(chave.N):
+        raise ValueError("A chave privada não corresponde ao contêiner.")
+
+    executor, proprio = _abrir_pool(processes, executor)
+    try:
+        while restante > 0:
+            quantidade = min(tamanho_lote, -(-restante // tamanho_bloco))
+            dados = _ler_exato(f, quantidade * largura)
+            cifras = [int.from_bytes(dados[i:i + largura], "big")
+                      for i in range(0, len(dados), largura)]
+            claros = rsa_decrypt_batch(cifras, chave, processes=processes, executor=executor)
+            saida = bytearray()
+            for m in claros:
+                tamanho = min(tamanho_bloco, restante)
+                try:
+                    saida += m.to_bytes(tamanho, "big")
+                except OverflowError:
+                    # outra chave do mesmo tamanho: o "claro" não cabe no bloco
+                    raise ValueError("A chave privada não corresponde ao contêiner.") from None
+                restante -= tamanho
+            yield bytes(saida)
+    finally:
+        if proprio:
+            executor.shutdown(cancel_futures=True)
+    if f.read(1):
+        raise ValueError("Há dados após o último bloco do contêiner.")
+
+
+def decifrar_em_blocos(container: BytesLike, chave_privada: ChavePrivada,
+                       processes: Optional[int] = None, executor: Optional[Executor] = None,
+                       tamanho_lote: int = TAMANHO_LOTE) -> bytes:
+    """Inverso de cifrar_em_blocos (devolve bytes; use .decode() para texto)."""
+    return b"".join(iterar_decifrado(container, chave_privada, processes, executor, tamanho_lote))
+
+
+def decifrar_arquivo_em_blocos(origem: str, destino: str, chave_privada: ChavePrivada,
+                               processes: Optional[int] = None, executor: Optional[Executor] = None,
+                               tamanho_lote: int = TAMANHO_LOTE) -> int:
+    """Decifra o contêiner em origem para destino, em fluxo. Retorna os bytes gravados."""
+    with open(origem, "rb") as entrada:
+        return _gravar(destino, iterar_decifrado(entrada, chave_privada, processes, executor, tamanho_lote))
+
+
+def algoritmo_rsa_em_blocos(chave_publica: Tuple[int, int], chave_privada: ChavePrivada,
+                            processes: Optional[int] = None) -> Dict[str, Callable[[str], str]]:
+    """
+    Funções "cifrar" e "decifrar" no formato de comparar_algoritmos: o
+    texto inteiro é cifrado e o contêiner vai como Base64.
+    """
+    chave = CRTPrivateKey.from_private_key(chave_privada)
+
+    def cifrar(texto: str) -> str:
+        return base64.b64encode(cifrar_em_blocos(texto, chave_publica, processes)).decode("ascii")
+
+    def decifrar(cifrado: str) -> str:
+        return decifrar_em_blocos(base64.b64decode(cifrado), chave, processes).decode("utf-8")
+
+    return {"cifrar": cifrar, "decifrar": decifrar}
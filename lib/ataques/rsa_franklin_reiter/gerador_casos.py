@@ -1,8 +1,22 @@
 from typing import Dict, Optional, Tuple
 from .util_rsa import generate_rsa_keypair as gerador_rsa_chaves, rsa_encrypt as rsa_encriptador
 from crypto_io.util_io import texto_para_inteiro
+from .pool_chaves import PoolChaves, E_PADRAO
 import secrets
 
+# pool de chaves pré-geradas usado por gerar_chaves (None = gerar na hora)
+_pool_chaves: Optional[PoolChaves] = None
+
+
+def definir_pool_chaves(pool: Optional[PoolChaves]) -> None:
+    """
+    Faz todos os gerar_caso_* retirarem chaves do pool indicado.
+    Passe None para voltar a gerar as chaves na hora.
+    """
+    global _pool_chaves
+    _pool_chaves = pool
+
+
 def gerar_chaves(bits: int, e_inicial: Optional[int] = None):
     """
     Gera chaves RSA.
@@ -12,6 +26,11 @@ def gerar_chaves(bits: int, e_inicial: Optional[int] = None):
     if bits < 256:
         raise ValueError("bits deve ser >= 256 (use >= 1024).")
 
+    if _pool_chaves is not None:
+        e = e_inicial if e_inicial is not None else E_PADRAO
+        n, e, d, _, _ = _pool_chaves.retirar(bits, e)
+        return n, e, d
+
     public_key, private_key = gerador_rsa_chaves(bits, e_inicial=e_inicial)
     e, n = public_key
     d, p, q = private_key
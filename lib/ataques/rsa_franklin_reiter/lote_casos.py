@@ -0,0 +1,214 @@
+"""
+Geração em massa de casos Franklin–Reiter reproduzíveis.
+
+Uma grade (bits, e, modo) com `quantidade` casos por combinação é
+dividida em blocos; cada bloco usa um random.Random próprio semeado só
+com (semente, bits, e, modo, bloco). Por isso o arquivo gerado é o mesmo
+com 1 ou N processos. Os casos são gravados à medida que os blocos
+terminam, em JSONL (uma linha por caso) ou num formato binário compacto
+que carrega mais rápido; iterar_casos lê os dois sob demanda.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import json
+import os
+import random
+import string
+import struct
+
+from .pool_chaves import gerar_chave_completa
+from crypto_io.util_io import texto_para_inteiro
+
+# m1, a e b sorteados em [0, n)
+ALEATORIO = "aleatorio"
+# a = 1: m2 = m1 + b, o caso clássico de mensagens com preenchimento
+DESLOCAMENTO = "deslocamento"
+# m1 vem de um texto ASCII sorteado; o caso guarda nbytes
+TEXTO = "texto"
+MODOS = (ALEATORIO, DESLOCAMENTO, TEXTO)
+
+JSONL = "jsonl"
+BINARIO = "binario"
+FORMATOS = (JSONL, BINARIO)
+
+MAGICO = b"CASOSFR1"
+# ordem dos campos no formato binário (modo é gravado pelo índice em MODOS)
+CAMPOS = ("indice", "bits", "e", "modo", "n", "d", "a", "b", "m1", "m2", "c1", "c2", "nbytes")
+TAMANHO_BLOCO = 64
+
+_ALFABETO = string.ascii_letters + string.digits + " "
+
+Caso = Dict[str, object]
+Tarefa = Tuple[int, int, str, int, int, int, int, int]
+
+
+def semente_do_bloco(semente: int, bits: int, e: int, modo: str, bloco: int) -> str:
+    """Semente do fluxo de um bloco; strings são semeadas igual em qualquer processo."""
+    return f"{semente}:{bits}:{e}:{modo}:{bloco}"
+
+
+def _sortear_caso(rng: random.Random, n: int, e: int, modo: str) -> Tuple[int, int, int, Optional[int]]:
+    if modo == TEXTO:
+        nbytes = rng.randint(1, (n.bit_length() - 1) // 8)
+        texto = "".join(rng.choice(_ALFABETO) for _ in range(nbytes))
+        m1, nbytes = texto_para_inteiro(texto)
+    else:
+        nbytes = None
+        m1 = rng.randrange(2, n)
+    a = 1 if modo == DESLOCAMENTO else rng.randrange(1, n)
+    while True:
+        b = rng.randrange(1, n)
+        if (a * m1 + b) % n != m1:
+            return m1, a, b, nbytes
+
+
+def gerar_bloco_de_casos(bits: int, e: int, modo: str, semente: int, bloco: int,
+                         inicio: int, quantidade: int, casos_por_chave: int = 1) -> List[Caso]:
+    """
+    Gera os casos inicio .. inicio+quantidade-1 de (bits, e, modo).
+    bits é o tamanho de cada primo, como em gerar_chave_completa.
+    Uma chave nova é sorteada a cada casos_por_chave casos.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo desconhecido: {modo!r} (use um de {MODOS}).")
+    rng = random.Random(semente_do_bloco(semente, bits, e, modo, bloco))
+    casos = []
+    for i in range(quantidade):
+        if i % casos_por_chave == 0:
+            n, e, d, _, _ = gerar_chave_completa(bits, e, rng)
+        m1, a, b, nbytes = _sortear_caso(rng, n, e, modo)
+        m2 = (a * m1 + b) % n
+        casos.append({
+            "indice": inicio + i, "bits": bits, "e": e, "modo": modo,
+            "n": n, "d": d, "a": a, "b": b, "m1": m1, "m2": m2,
+            "c1": pow(m1, e, n), "c2": pow(m2, e, n), "nbytes": nbytes,
+        })
+    return casos
+
+
+def _gerar_tarefa(tarefa: Tarefa) -> List[Caso]:
+    return gerar_bloco_de_casos(*tarefa)
+
+
+def _tarefas(quantidade: int, bits: Iterable[int], expoentes: Iterable[int], modos: Iterable[str],
+             semente: int, tamanho_bloco: int, casos_por_chave: int) -> List[Tarefa]:
+    # blocos múltiplos de casos_por_chave para não repartir uma chave entre blocos
+    tamanho_bloco = max(casos_por_chave, tamanho_bloco - tamanho_bloco % casos_por_chave)
+    tarefas = []
+    for tb in bits:
+        for e in expoentes:
+            for modo in modos:
+                if modo not in MODOS:
+                    raise ValueError(f"Modo desconhecido: {modo!r} (use um de {MODOS}).")
+                for bloco, inicio in enumerate(range(0, quantidade, tamanho_bloco)):
+                    tarefas.append((tb, e, modo, semente, bloco, inicio,
+                                    min(tamanho_bloco, quantidade - inicio), casos_por_chave))
+    return tarefas
+
+
+def _formato_de(caminho: str, formato: Optional[str]) -> str:
+    if formato is None:
+        return JSONL if caminho.endswith((".jsonl", ".json")) else BINARIO
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato!r} (use um de {FORMATOS}).")
+    return formato
+
+
+def _inteiro_para_registro(x: int) -> bytes:
+    dados = x.to_bytes((x.bit_length() + 7) // 8, "big")
+    return struct.pack(">I", len(dados)) + dados
+
+
+def _caso_para_binario(caso: Caso) -> bytes:
+    valores = dict(caso, modo=MODOS.index(caso["modo"]), nbytes=caso["nbytes"] or 0)
+    return b"".join(_inteiro_para_registro(valores[c]) for c in CAMPOS)
+
+
+def _ler_inteiro(f) -> Optional[int]:
+    cabecalho = f.read(4)
+    if not cabecalho:
+        return None
+    if len(cabecalho) < 4:
+        raise ValueError("Arquivo de casos truncado.")
+    (tamanho,) = struct.unpack(">I", cabecalho)
+    dados = f.read(tamanho)
+    if len(dados) < tamanho:
+        raise ValueError("Arquivo de casos truncado.")
+    return int.from_bytes(dados, "big")
+
+
+def gerar_casos_em_lote(caminho: str, quantidade: int, bits: Iterable[int] = (512,),
+                        expoentes: Iterable[int] = (3,), modos: Iterable[str] = (ALEATORIO,),
+                        semente: int = 0, processes: Optional[int] = None,
+                        executor: Optional[Executor] = None, tamanho_bloco: int = TAMANHO_BLOCO,
+                        casos_por_chave: int = 1, formato: Optional[str] = None) -> int:
+    """
+    Gera `quantidade` casos para cada combinação (bits, e, modo) e grava em
+    caminho, em ordem de grade. Retorna o total de casos gravados.
+
+    formato: "jsonl" ou "binario" (None: jsonl se caminho terminar em
+    .jsonl/.json, senão binário). Com processes > 1 (ou um executor), os
+    blocos são gerados no pool e gravados assim que chegam, na ordem.
+    O conteúdo depende só dos parâmetros e da semente.
+    """
+    if quantidade < 0:
+        raise ValueError("quantidade deve ser >= 0.")
+    if casos_por_chave < 1:
+        raise ValueError("casos_por_chave deve ser >= 1.")
+    formato = _formato_de(caminho, formato)
+    tarefas = _tarefas(quantidade, list(bits), list(expoentes), list(modos),
+                       semente, tamanho_bloco, casos_por_chave)
+
+    proprio = executor is None and processes is not None and processes > 1
+    if proprio:
+        executor = ProcessPoolExecutor(max_workers=processes)
+    blocos = executor.map(_gerar_tarefa, tarefas) if executor is not None else map(_gerar_tarefa, tarefas)
+
+    total = 0
+    tmp = caminho + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            if formato == BINARIO:
+                f.write(MAGICO)
+            for casos in blocos:
+                if formato == BINARIO:
+                    f.write(b"".join(_caso_para_binario(c) for c in casos))
+                else:
+                    f.write("".join(json.dumps(c) + "\n" for c in casos).encode("utf-8"))
+                total += len(casos)
+        os.replace(tmp, caminho)
+    finally:
+        if proprio:
+            executor.shutdown(cancel_futures=True)
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return total
+
+
+def iterar_casos(caminho: str) -> Iterator[Caso]:
+    """
+    Lê os casos gravados por gerar_casos_em_lote, um por vez, sem carregar
+    o arquivo inteiro. O formato é detectado pelo cabeçalho.
+    """
+    with open(caminho, "rb") as f:
+        if f.read(len(MAGICO)) != MAGICO:
+            f.seek(0)
+            for linha in f:
+                if linha.strip():
+                    yield json.loads(linha)
+            return
+        while True:
+            primeiro = _ler_inteiro(f)
+            if primeiro is None:
+                return
+            valores = [primeiro]
+            for _ in CAMPOS[1:]:
+                valor = _ler_inteiro(f)
+                if valor is None:
+                    raise ValueError("Arquivo de casos truncado.")
+                valores.append(valor)
+            caso = dict(zip(CAMPOS, valores))
+            caso["modo"] = MODOS[caso["modo"]]
+            caso["nbytes"] = caso["nbytes"] or None
+            yield caso
@@ -3,9 +3,12 @@
 - Eliane: construir_polinomio_de_relacao
 - Stephany: tentar_recuperar_mensagem
 """
-from math import comb
-from sympy import symbols, Poly, gcd, expand
-from lib.ataques.rsa_franklin_reiter.polynomial import poly_eval
+from functools import lru_cache
+from math import gcd as mdc_inteiros
+from typing import Iterable, Iterator
+from lib.ataques.rsa_franklin_reiter import backend_inteiros as backend
+from lib.ataques.rsa_franklin_reiter.aritmetica_modular import modinv_lote, contexto_para
+from lib.ataques.rsa_franklin_reiter.polynomial import poly_eval, poly_gcd, FatorEncontrado
 
 def expandir_relacao_linear(a: int, b: int, e: int, c: int, n: int | None = None) -> list[int]:
     """
@@ -40,25 +43,14 @@ def expandir_relacao_linear(a: int, b: int, e: int, c: int, n: int | None = None
     if e > 1_000_000:
         raise ValueError("Expoente 'e' muito grande para expandir o polinômio.")
 
-    coefs = [0] * (e + 1)
-
-    for k in range(e + 1):
-        # coerciona a/b para int antes de operações repetidas
-        if k == 0:
-            a_int = int(a)
-            b_int = int(b)
-        ak = pow(int(a_int), k, n) if n is not None else (int(a_int) ** k)
-
-        # b^(e-k) mod n
-        bek = pow(int(b_int), e - k, n) if n is not None else (int(b_int) ** (e - k))
-        
-        # expansão do binômio: (a*m1 + b)^e = soma(k=0 até e) [comb(e,k) * (a*m1)^k * b^(e-k)]
-        # como estamos construindo o polinômio em m1, o coeficiente do termo m1^k é:  
-        coef = comb(e, k) * ak * bek
-        if n is not None:
-            coef %= int(n)
+    a = int(a)
+    b = int(b)
+    if n is not None:
+        n = int(n)
+        a %= n
+        b %= n
 
-        coefs[k] = int(coef)
+    coefs = list(_expansao_binomial(a, b, e, n))
 
     # subtrai a cifra do termo constante
     if n is None:
@@ -69,6 +61,113 @@ def expandir_relacao_linear(a: int, b: int, e: int, c: int, n: int | None = None
     return coefs
 
 
+def _binomiais(e: int, n: int | None):
+    """
+    Gera C(e, k) para k = 0..e pela recorrência C(e,k+1) = C(e,k)(e-k)/(k+1).
+    Com n, os valores saem mod n e a divisão vira multiplicação pelos
+    inversos de 1..e, calculados de uma vez com modinv_lote; se algum não
+    existir (n pequeno), os binomiais exatos são reduzidos.
+    """
+    if n is not None:
+        try:
+            inversos = modinv_lote(list(range(1, e + 1)), n)
+        except ValueError:
+            inversos = None
+        if inversos is not None:
+            binomial = 1 % n
+            for k in range(e):
+                yield binomial
+                binomial = (binomial * (e - k) * inversos[k]) % n
+            yield binomial
+            return
+
+    binomial = 1
+    for k in range(e):
+        yield binomial if n is None else binomial % n
+        binomial = binomial * (e - k) // (k + 1)
+    yield binomial if n is None else binomial % n
+
+
+def _expansao_binomial(a: int, b: int, e: int, n: int | None) -> tuple[int, ...]:
+    """
+    Coeficientes de (a*x + b)^e, em ordem crescente (mod n se n não for None).
+
+    Com b = 0 (caso de f1 = x^e) o resultado é um único monômio, montado
+    na hora. Os demais ficam em cache por (a, b, e, n) para ataques
+    repetidos com a mesma relação; só as duas últimas expansões são
+    guardadas, porque cada uma tem e + 1 coeficientes do tamanho de n
+    (~19 MB com e = 65537 e n de 2048 bits). Veja limpar_cache_expansao.
+    """
+    if b == 0:
+        coefs = [0] * (e + 1)
+        coefs[e] = backend.potencia(a, e, n) if n is not None else a ** e
+        return tuple(coefs)
+    return _expansao_em_cache(a, b, e, n)
+
+
+def limpar_cache_expansao() -> None:
+    """Descarta as expansões de (a*x + b)^e guardadas em cache."""
+    _expansao_em_cache.cache_clear()
+
+
+@lru_cache(maxsize=2)
+def _expansao_em_cache(a: int, b: int, e: int, n: int | None) -> tuple[int, ...]:
+    """
+    Expansão de _expansao_binomial para b != 0, por produtos acumulados,
+    sem exponenciações por coeficiente.
+    """
+    coefs = [0] * (e + 1)
+
+    # Caminho principal (mod n, b invertível): cada termo sai do anterior por
+    #   t(k+1) = t(k) * (e-k)/(k+1) * a/b,   t(0) = b^e
+    # são só duas multiplicações modulares por coeficiente.
+    if n is not None and b != 0:
+        try:
+            inversos = modinv_lote(list(range(1, e + 1)) + [b], n)
+        except ValueError:
+            inversos = None
+        if inversos is not None:
+            m = backend.nativo(n)
+            razao = (a * inversos[-1]) % m
+            termo = backend.nativo(backend.potencia(b, e, n))
+            coefs[0] = termo
+            contexto = contexto_para(n)
+            if contexto.barrett:
+                # termo * (e-k) * razao < n^2 * 2^20 cabe na folga do contexto
+                reduzir = contexto.reduzir
+                for k in range(e):
+                    termo = reduzir(reduzir(termo * (e - k) * razao) * inversos[k])
+                    coefs[k + 1] = termo
+                return tuple(coefs)
+            for k in range(e):
+                termo = ((termo * (e - k) * razao) % m * inversos[k]) % m
+                coefs[k + 1] = termo
+            if backend.usando_gmpy2():
+                return tuple(int(c) for c in coefs)
+            return tuple(coefs)
+
+    # Caso geral (sem módulo, b = 0 ou inversos inexistentes): uma passada de
+    # ida calcula C(e,k)*a^k e uma de volta multiplica por b^(e-k).
+
+    potencia_a = 1
+    for k, binomial in enumerate(_binomiais(e, n)):
+        coefs[k] = binomial * potencia_a
+        potencia_a *= a
+        if n is not None:
+            coefs[k] %= n
+            potencia_a %= n
+
+    potencia_b = 1
+    for k in range(e, -1, -1):
+        coefs[k] *= potencia_b
+        potencia_b *= b
+        if n is not None:
+            coefs[k] %= n
+            potencia_b %= n
+
+    return tuple(coefs)
+
+
 def construir_polinomio_para_cifra(e: int, c1: int, a: int, b: int, c2: int, n: int | None = None) -> tuple[list[int], list[int]]:
     """
     Constrói dois polinômios usados no ataque Franklin–Reiter:
@@ -128,42 +227,202 @@ def construir_polinomio_de_relacao(a: int, b: int, e: int, c: int, n: int) -> li
     return expandir_relacao_linear(a, b, e, c, n)
 
 
-def tentativa_de_recuperacao_de_mensagem(c1: int, c2: int, a: int, b: int, e: int, n: int) -> int | None:
+# Forma fechada para expoentes pequenos
+#
+# Com y = a*m1, o par vira y^e = C1 (= a^e * c1) e (y + B)^e = C2 (= c2),
+# B = b. O primeiro subresultante de x^e - C1 e (x + B)^e - C2 é linear em
+# x e, quando o gcd é linear, é proporcional a ele; tirando o fator comum
+# e*B, a raiz é y = B * num / den, com num e den homogêneos em C1, C2 e
+# beta = B^e. Cada termo (i, j, l, coef) vale coef * C1^i * C2^j * beta^l.
+# Tabelas geradas com sympy.subresultants. Para e = 3:
+#   y = B * (2*C1 + C2 - B^3) / (C2 - C1 + 2*B^3)
+
+FORMULAS_FECHADAS = {
+    3: (
+        ((1, 0, 0, 2), (0, 1, 0, 1), (0, 0, 1, -1)),
+        ((1, 0, 0, -1), (0, 1, 0, 1), (0, 0, 1, 2)),
+    ),
+    5: (
+        ((3, 0, 0, 3), (2, 1, 0, -4), (2, 0, 1, -51), (1, 2, 0, -1), (1, 1, 1, -88), (1, 0, 2, 64),
+         (0, 3, 0, 2), (0, 2, 1, 14), (0, 1, 2, -9), (0, 0, 3, -7)),
+        ((3, 0, 0, -1), (2, 1, 0, 3), (2, 0, 1, 37), (1, 2, 0, -3), (1, 1, 1, 176), (1, 0, 2, -73),
+         (0, 3, 0, 1), (0, 2, 1, 37), (0, 1, 2, 73), (0, 0, 3, 14)),
+    ),
+    7: (
+        ((5, 0, 0, 4), (4, 1, 0, -13), (4, 0, 1, -687), (3, 2, 0, 12), (3, 1, 1, -18098),
+         (3, 0, 2, 5738), (2, 3, 0, 2), (2, 2, 1, -19102), (2, 1, 2, -179950), (2, 0, 3, -8122),
+         (1, 4, 0, -8), (1, 3, 1, 4008), (1, 2, 2, 48392), (1, 1, 3, -73790), (1, 0, 4, 2190),
+         (0, 5, 0, 3), (0, 4, 1, 265), (0, 3, 2, 968), (0, 2, 3, -408), (0, 1, 4, -762),
+         (0, 0, 5, -66)),
+        ((5, 0, 0, -1), (4, 1, 0, 5), (4, 0, 1, 422), (3, 2, 0, -10), (3, 1, 1, 14090),
+         (3, 0, 2, -4770), (2, 3, 0, 10), (2, 2, 1, 38204), (2, 1, 2, 228342), (2, 0, 3, 8530),
+         (1, 4, 0, -5), (1, 3, 1, 14090), (1, 2, 2, -228342), (1, 1, 3, 147580), (1, 0, 4, -2952),
+         (0, 5, 0, 1), (0, 4, 1, 422), (0, 3, 2, 4770), (0, 2, 3, 8530), (0, 1, 4, 2952),
+         (0, 0, 5, 132)),
+    ),
+}
+
+
+def _avaliar_formula(termos, potencias_c1: list[int], potencias_c2: list[int],
+                     potencias_beta: list[int], n: int) -> int:
+    total = 0
+    for i, j, l, coef in termos:
+        total += coef * (potencias_c1[i] * potencias_c2[j] % n) * potencias_beta[l]
+    return total % n
+
+
+def _potencias(base: int, k: int, n: int) -> list[int]:
+    potencias = [1]
+    for _ in range(k):
+        potencias.append(potencias[-1] * base % n)
+    return potencias
+
+
+def recuperar_mensagem_forma_fechada(c1: int, c2: int, a: int, b: int, e: int, n: int) -> int | None:
     """
-    Recupera m1 usando o ataque Franklin–Reiter corretamente,
-    via gcd de polinômios módulo n.
+    Franklin–Reiter sem gcd de polinômios para e em FORMULAS_FECHADAS
+    (3, 5 e 7): algumas multiplicações modulares e uma inversão.
+
+    Retorna None se e não tiver fórmula ou se o denominador não for
+    invertível (por exemplo b = 0 ou relação trivial); nesses casos o
+    chamador deve usar o caminho pelo gcd.
     """
+    formula = FORMULAS_FECHADAS.get(int(e))
+    if formula is None:
+        return None
+    e, n = int(e), int(n)
+    a, b, c1 = int(a) % n, int(b) % n, int(c1) % n
+
+    C1 = backend.potencia(a, e, n) * c1 % n
+    C2 = int(c2) % n
+    grau = e - 2  # grau de num e den em (C1, C2, beta)
+    potencias = (_potencias(C1, grau, n), _potencias(C2, grau, n), _potencias(backend.potencia(b, e, n), grau, n))
+
+    numerador = b * _avaliar_formula(formula[0], *potencias, n) % n
+    denominador = _avaliar_formula(formula[1], *potencias, n)
+    try:
+        inverso = backend.inverso(denominador * a % n, n)
+    except ValueError:
+        return None
 
-    x = symbols('x')
+    m1 = numerador * inverso % n
+    return m1 if backend.potencia(m1, e, n) == c1 else None
 
 
+def raiz_de_polinomio_linear(g: list[int], n: int) -> int | None:
+    """
+    Retorna a raiz de g0 + g1*x (mod n), ou None se g não for linear
+    ou se g1 não for invertível.
+    """
+    if len(g) != 2:
+        return None
+    g0, g1 = g[0] % n, g[1] % n
     try:
-        f = Poly(x**e - int(c1), x)  # coeficientes inteiros
-        g = Poly(expand((a * x + b) ** e - int(c2)), x)
+        inv_g1 = backend.inverso(g1, n)
+    except ValueError:
+        return None
+    return (-g0 * inv_g1) % n
 
-        # gcd polinomial sobre Z[x]
-        d = gcd(f, g)
-    except Exception:
-        # Se algo der errado com coeficientes inteiros, tentamos fallback usando
-        # o método modular (com risco de falha quando n é composto).
-        f = Poly(x**e - int(c1), x, modulus=n)
-        g = Poly((a * x + b) ** e - int(c2), x, modulus=n)
-        d = gcd(f, g)
 
-    # gcd deve ser linear: x - m1
-    if d.degree() != 1:
-        return None  # ataque falhou
+def _mensagem_pelo_fator(fator: int, c1: int, e: int, n: int) -> int | None:
+    """Com um fator de n em mãos, decifra c1 calculando a chave privada."""
+    p, q = fator, n // fator
+    phi = (p - 1) * (q - 1)
+    if p * q != n or mdc_inteiros(e, phi) != 1:
+        return None
+    return backend.potencia(int(c1), backend.inverso(e, phi), n)
+
+
+def _conferir_com_sympy(m1: int | None, c1: int, c2: int, a: int, b: int, e: int, n: int) -> bool:
+    """
+    Verificação cruzada independente via SymPy: confere a expansão de
+    (a*x + b)^e - c2 (mod n) e, se houver m1, que ele é raiz de f1 e f2.
+    (O gcd do SymPy não aceita módulo composto, então não é usado.)
+    """
+    from sympy import symbols, Poly
+
+    x = symbols('x')
+    f2 = Poly((a * x + b) ** e - int(c2), x, modulus=n)
+    coefs = [int(c) % n for c in reversed(f2.all_coeffs())]
+    coefs += [0] * (e + 1 - len(coefs))
+
+    if coefs != construir_polinomio_de_relacao(a, b, e, c2, n):
+        return False
+    if m1 is None:
+        return True
+    return pow(m1, e, n) == int(c1) % n and poly_eval(coefs, m1, n) == 0
 
-    # extrair raiz do polinômio linear a*x + b
-    a1, b1 = d.all_coeffs() 
 
-    a1 = a1 % n
-    b1 = b1 % n
+def tentativa_de_recuperacao_de_mensagem(c1: int, c2: int, a: int, b: int, e: int, n: int,
+                                         verificar_com_sympy: bool = False) -> int | None:
+    """
+    Recupera m1 usando o ataque Franklin–Reiter corretamente,
+    via gcd de polinômios módulo n.
 
+    Para e = 3, 5 e 7 tenta antes a forma fechada
+    (recuperar_mensagem_forma_fechada). Senão, tudo é feito com a
+    aritmética modular do projeto: f1 = x^e - c1 e f2 = (a*x + b)^e - c2 (mod n), poly_gcd e a raiz do
+    gcd linear. Se alguma divisão revelar um fator de n, m1 é obtido
+    decifrando c1 com a chave reconstruída.
+
+    verificar_com_sympy: confere a expansão e a raiz com o SymPy (precisa
+    estar instalado) e lança RuntimeError se algo divergir.
+    """
+    e = int(e)
+    n = int(n)
+    c1 = int(c1)
+
+    m1 = recuperar_mensagem_forma_fechada(c1, c2, a, b, e, n)
+    if m1 is None:
+        f1 = construir_polinomio_de_relacao(1, 0, e, c1, n)
+        f2 = construir_polinomio_de_relacao(a, b, e, c2, n)
+        m1 = _recuperar_pelo_mdc(f1, f2, c1, e, n)
+
+    if verificar_com_sympy and not _conferir_com_sympy(m1, c1, c2, a, b, e, n):
+        raise RuntimeError("Divergência entre o caminho modular e a verificação com SymPy.")
+
+    return m1
+
+
+def _recuperar_pelo_mdc(f1: list[int], f2: list[int], c1: int, e: int, n: int) -> int | None:
+    """m1 a partir de f1 e f2 já montados (mod n), ou None."""
     try:
-        inv_a1 = pow(a1, -1, n)
-    except ValueError:
-        return None 
+        d = poly_gcd(f1, f2, n)
+        m1 = raiz_de_polinomio_linear(d, n)
+    except FatorEncontrado as erro:
+        m1 = _mensagem_pelo_fator(erro.fator, c1, e, n)
+
+    # gcd deve ser linear: x - m1 (confere que m1 é raiz de f1 = x^e - c1)
+    if m1 is not None and backend.potencia(m1, e, n) != c1 % n:
+        m1 = None
+    return m1
+
 
-    m1 = (-b1 * inv_a1) % n
-    return m1
\ No newline at end of file
+def recuperar_mensagens_em_lote(pares: Iterable[tuple[int, int]], a: int, b: int, e: int,
+                                n: int) -> Iterator[int | None]:
+    """
+    Franklin–Reiter para vários pares (c1, c2) com os mesmos n, e, a, b.
+
+    x^e e a expansão de (a*x + b)^e não dependem das cifras: são montados
+    uma vez e, para cada par, só os termos constantes (-c1 e -c2) mudam.
+    Para e = 3, 5 e 7 a forma fechada dispensa os polinômios.
+    Gera m1 (ou None) para cada par, na ordem de entrada.
+    """
+    e = int(e)
+    n = int(n)
+    expansao = None
+
+    for c1, c2 in pares:
+        c1 = int(c1)
+        m1 = recuperar_mensagem_forma_fechada(c1, c2, a, b, e, n)
+        if m1 is not None:
+            yield m1
+            continue
+        if expansao is None:
+            expansao = _expansao_binomial(int(a) % n, int(b) % n, e, n)
+        f1 = [0] * (e + 1)
+        f1[0] = -c1 % n
+        f1[e] = 1
+        f2 = list(expansao)
+        f2[0] = (f2[0] - int(c2)) % n
+        yield _recuperar_pelo_mdc(f1, f2, c1, e, n)
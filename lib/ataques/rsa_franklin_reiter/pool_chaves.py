@@ -0,0 +1,203 @@
+"""
+Geração paralela de chaves RSA e pool de chaves pré-geradas em disco.
+
+A busca por primos domina o tempo de geração dos casos de teste. Aqui
+p e q são buscados em processos separados, e o PoolChaves guarda chaves
+prontas por (bits, e) em arquivos JSONL, repondo o estoque em segundo
+plano conforme as chaves são retiradas.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from math import gcd
+from typing import Deque, Dict, List, Optional, Tuple
+import json
+import os
+import random
+import threading
+
+from .util_rsa import generate_prime, build_rsa_keypair
+
+E_PADRAO = 65537
+
+# (n, e, d, p, q)
+Chave = Tuple[int, int, int, int, int]
+
+
+def gerar_primo_para_e(bits: int, e: int, rng: Optional[random.Random] = None) -> int:
+    """Gera um primo p de 'bits' bits com gcd(e, p - 1) == 1."""
+    while True:
+        p = generate_prime(bits, rng)
+        if gcd(e, p - 1) == 1:
+            return p
+
+
+def gerar_chave_completa(bits: int, e: int = E_PADRAO, rng: Optional[random.Random] = None) -> Chave:
+    """
+    Gera uma chave (n, e, d, p, q) serialmente, com exatamente o expoente e.
+    Com rng, a chave depende só do estado desse gerador.
+    """
+    p = gerar_primo_para_e(bits, e, rng)
+    q = gerar_primo_para_e(bits, e, rng)
+    while q == p:
+        q = gerar_primo_para_e(bits, e, rng)
+    (e, n), (d, p, q) = build_rsa_keypair(p, q, e)
+    return n, e, d, p, q
+
+
+def gerar_chaves_paralelo(bits: int, e_inicial: Optional[int] = None, executor: Optional[Executor] = None):
+    """
+    Mesmo retorno de generate_rsa_keypair, mas p e q são buscados ao mesmo
+    tempo em dois processos. Se executor não for passado, um pool de dois
+    processos é criado só para esta chamada.
+    """
+    e = e_inicial if e_inicial is not None else E_PADRAO
+    proprio = executor is None
+    if proprio:
+        executor = ProcessPoolExecutor(max_workers=2)
+    try:
+        futuro_p = executor.submit(gerar_primo_para_e, bits, e)
+        futuro_q = executor.submit(gerar_primo_para_e, bits, e)
+        p, q = futuro_p.result(), futuro_q.result()
+        while q == p:
+            q = executor.submit(gerar_primo_para_e, bits, e).result()
+    finally:
+        if proprio:
+            executor.shutdown()
+    return build_rsa_keypair(p, q, e)
+
+
+class PoolChaves:
+    """
+    Estoque persistente de chaves RSA por (bits, e).
+
+    Cada (bits, e) fica em <diretorio>/chaves_<bits>_<e>.jsonl. retirar()
+    entrega uma chave do estoque (cada chave é usada uma única vez) e
+    regrava o arquivo na hora, para que a chave não volte ao estoque se o
+    processo terminar sem fechar(). Se o estoque cair abaixo de minimo,
+    agenda reposição em segundo plano até alvo chaves. Com o estoque
+    vazio, retirar() espera a reposição em andamento ou gera a chave na hora.
+
+    Use como gerenciador de contexto, ou chame fechar(), para gravar as
+    chaves repostas e encerrar os processos.
+    """
+
+    def __init__(self, diretorio: str, alvo: int = 32, minimo: Optional[int] = None,
+                 max_processos: Optional[int] = None):
+        if alvo <= 0:
+            raise ValueError("alvo deve ser positivo.")
+        os.makedirs(diretorio, exist_ok=True)
+        self.diretorio = diretorio
+        self.alvo = alvo
+        self.minimo = alvo // 4 if minimo is None else minimo
+        self.max_processos = max_processos
+        self._estoque: Dict[Tuple[int, int], Deque[Chave]] = {}
+        self._pendentes: Dict[Tuple[int, int], List[Future]] = {}
+        self._alterados = set()
+        self._trava = threading.RLock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _caminho(self, bits: int, e: int) -> str:
+        return os.path.join(self.diretorio, f"chaves_{bits}_{e}.jsonl")
+
+    def _fila(self, bits: int, e: int) -> Deque[Chave]:
+        chave = (bits, e)
+        if chave not in self._estoque:
+            fila = deque()
+            caminho = self._caminho(bits, e)
+            if os.path.exists(caminho):
+                with open(caminho, "r", encoding="utf-8") as f:
+                    for linha in f:
+                        if linha.strip():
+                            r = json.loads(linha)
+                            fila.append((r["n"], r["e"], r["d"], r["p"], r["q"]))
+            self._estoque[chave] = fila
+        return self._estoque[chave]
+
+    def _obter_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_processos)
+        return self._executor
+
+    def _receber(self, bits: int, e: int, futuro: Future) -> None:
+        with self._trava:
+            pendentes = self._pendentes.get((bits, e), [])
+            if futuro not in pendentes:
+                return  # já recebido
+            pendentes.remove(futuro)
+            if not futuro.cancelled() and futuro.exception() is None:
+                self._fila(bits, e).append(futuro.result())
+                self._alterados.add((bits, e))
+
+    def repor(self, bits: int, e: int = E_PADRAO, quantidade: Optional[int] = None) -> None:
+        """
+        Agenda a geração de chaves em segundo plano até o estoque chegar
+        a alvo (ou agenda exatamente 'quantidade' chaves).
+        """
+        with self._trava:
+            pendentes = self._pendentes.setdefault((bits, e), [])
+            if quantidade is None:
+                quantidade = self.alvo - len(self._fila(bits, e)) - len(pendentes)
+            executor = self._obter_executor()
+            for _ in range(max(0, quantidade)):
+                futuro = executor.submit(gerar_chave_completa, bits, e)
+                pendentes.append(futuro)
+                futuro.add_done_callback(lambda f, bits=bits, e=e: self._receber(bits, e, f))
+
+    def disponiveis(self, bits: int, e: int = E_PADRAO) -> int:
+        with self._trava:
+            return len(self._fila(bits, e))
+
+    def retirar(self, bits: int, e: int = E_PADRAO) -> Chave:
+        """Retira uma chave (n, e, d, p, q) do estoque."""
+        while True:
+            with self._trava:
+                fila = self._fila(bits, e)
+                if fila:
+                    chave = fila.popleft()
+                    self._gravar(bits, e)
+                    if len(fila) + len(self._pendentes.get((bits, e), [])) < self.minimo:
+                        self.repor(bits, e)
+                    return chave
+                pendentes = list(self._pendentes.get((bits, e), []))
+            if not pendentes:
+                self.repor(bits, e)
+                with self._trava:
+                    pendentes = list(self._pendentes.get((bits, e), []))
+                if not pendentes:
+                    return gerar_chave_completa(bits, e)
+            pendentes[0].result()
+            # o callback de conclusão pode rodar logo depois de result()
+            self._receber(bits, e, pendentes[0])
+
+    def _gravar(self, bits: int, e: int) -> None:
+        """Regrava o arquivo de (bits, e) com o estoque atual (chamar com a trava)."""
+        caminho = self._caminho(bits, e)
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            for n, e_, d, p, q in self._fila(bits, e):
+                f.write(json.dumps({"n": n, "e": e_, "d": d, "p": p, "q": q}) + "\n")
+        os.replace(temporario, caminho)
+        self._alterados.discard((bits, e))
+
+    def salvar(self) -> None:
+        """Grava no disco o estoque atual de cada (bits, e) alterado."""
+        with self._trava:
+            for bits, e in list(self._alterados):
+                self._gravar(bits, e)
+
+    def fechar(self, esperar: bool = False) -> None:
+        """
+        Encerra o pool de processos e grava o estoque.
+        Com esperar=True, as reposições em andamento terminam antes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=esperar, cancel_futures=not esperar)
+            self._executor = None
+        self.salvar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
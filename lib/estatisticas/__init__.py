@@ -4,37 +4,23 @@ Pacote estatisticas
 Funções para análise estatística geral de textos.
 """
 
-from .algoritmos import (
-    medir_tempo,
-    expansao_tamanho,
-    calcular_avalanche,
-)
+from crypto_io._importacao import exportar_sob_demanda
 
-from .comparacoes import comparar_algoritmos
+_EXPORTACOES = {
+    "medir_tempo": ".algoritmos",
+    "expansao_tamanho": ".algoritmos",
+    "calcular_avalanche": ".algoritmos",
+    "comparar_algoritmos": ".comparacoes",
+    "contar_frequencias": ".texto",
+    "indice_coincidencia": ".texto",
+    "tamanho_bytes": ".texto",
+    "entropia": ".texto",
+    "matriz_coocorrencia": ".texto",
+    "gerar_dados_cripto_graficos": ".texto",
+    "matriz_original_vs_cifrada": ".texto",
+    "autocorrelacao_normalizada": ".texto",
+}
 
-from .texto import (
-    contar_frequencias,
-    indice_coincidencia,
-    tamanho_bytes,
-    entropia, 
-    matriz_coocorrencia,
-    gerar_dados_cripto_graficos,
-    matriz_original_vs_cifrada,
-    autocorrelacao_normalizada
-)
+__all__ = list(_EXPORTACOES)
 
-__all__ = [
-    "medir_tempo",
-    "expansao_tamanho",
-    "calcular_avalanche",
-    "comparar_algoritmos",
-    "contar_frequencias",
-    "frequencia_relativa",
-    "indice_coincidencia",
-    "tamanho_bytes",
-    "entropia",
-    "matriz_coocorrencia"
-    "gerar_dados_cripto_graficos",
-    "matriz_original_vs_cifrada",
-    "autocorrelacao_normalizada"
-]
\ No newline at end of file
+__getattr__, __dir__ = exportar_sob_demanda(__name__, globals(), _EXPORTACOES)
@@ -17,7 +17,8 @@ def comparar_algoritmos(textos: Dict[str, str], algoritmos: Dict[str, Dict[str,
             tempo_cifra = time.perf_counter() - start
 
             tempo_decifra = medir_tempo(funcs["decifrar"], cifrado)
-            tempo_ataque = medir_tempo(funcs["atacar"], cifrado)
+            # "atacar" é opcional (ex.: RSA em blocos só cifra e decifra)
+            tempo_ataque = medir_tempo(funcs["atacar"], cifrado) if "atacar" in funcs else None
 
             tamanho_bytes = len(texto.encode('utf-8'))
 
@@ -5,7 +5,6 @@ Funções para análise estatística geral de textos.
 import math
 from typing import Dict
 from collections import Counter
-import numpy as np
 
 from lib.ataques.analise_de_frequencia import (
     contar_frequencias,
@@ -0,0 +1,123 @@
+"""
+Testes unitários para aritmetica_modular.py
+Executar com: pytest -v
+"""
+
+import os
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.ataques.rsa_franklin_reiter.aritmetica_modular import (
+    egcd,
+    modinv,
+    modinv_lote,
+    crivo_primos,
+    passa_teste_base_2,
+    PRIMOS_PEQUENOS,
+    ContextoModular,
+    contexto_para,
+    reciproco,
+)
+
+
+def test_egcd_identidade_de_bezout():
+    for a, b in [(240, 46), (17, 5), (0, 7), (7, 0), (-30, 12)]:
+        g, x, y = egcd(a, b)
+        assert a * x + b * y == g
+
+
+def test_egcd_sem_limite_de_recursao():
+    # números de Fibonacci consecutivos são o pior caso do algoritmo de Euclides
+    a, b = 1, 1
+    for _ in range(5000):
+        a, b = b, a + b
+    g, x, y = egcd(b, a)
+    assert g == 1
+    assert b * x + a * y == 1
+
+
+def test_modinv_basico():
+    assert (3 * modinv(3, 11)) % 11 == 1
+    with pytest.raises(ValueError):
+        modinv(6, 9)
+
+
+def test_modinv_lote_igual_a_individual():
+    n = 1_000_003
+    valores = [2, 3, 5, 999_999, 123_456]
+    assert modinv_lote(valores, n) == [modinv(v, n) for v in valores]
+
+
+def test_modinv_lote_vazio():
+    assert modinv_lote([], 7) == []
+
+
+def test_modinv_lote_sem_inverso():
+    with pytest.raises(ValueError, match="a=6"):
+        modinv_lote([2, 6, 5], 9)
+
+
+def test_crivo_primos_pequenos():
+    assert crivo_primos(30) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert crivo_primos(2) == []
+    assert PRIMOS_PEQUENOS[0] == 3
+
+
+def test_passa_teste_base_2():
+    assert passa_teste_base_2(104729)
+    assert not passa_teste_base_2(104731)  # 11 * 9521
+    assert passa_teste_base_2(2047)  # pseudoprimo forte na base 2 (23 * 89)
+
+
+# 2^521 - 1 (primo de Mersenne)
+M521 = (1 << 521) - 1
+
+
+def test_contexto_barrett_igual_a_resto():
+    import random
+    rng = random.Random(5)
+    contexto = ContextoModular(M521, barrett=True)
+    valores = [rng.randrange(M521) * rng.randrange(M521) for _ in range(200)]
+    valores += [0, M521, M521 * M521 - 1, -12345, 1 << 2000]  # bordas e fora da faixa de Barrett
+    assert [contexto.reduzir(v) for v in valores] == [v % M521 for v in valores]
+    assert contexto.reduzir_vetor(valores) == [v % M521 for v in valores]
+    assert contexto.mul(M521 - 1, M521 - 1) == 1
+
+
+def test_contexto_soma_produtos_preguicosa():
+    import random
+    rng = random.Random(6)
+    xs = [rng.randrange(M521) for _ in range(100)]
+    ys = [rng.randrange(M521) for _ in range(100)]
+    esperado = sum(x * y for x, y in zip(xs, ys)) % M521
+    for barrett in (False, True):
+        contexto = ContextoModular(M521, barrett=barrett)
+        assert contexto.soma_produtos(xs, ys) == esperado
+
+        acumulador = contexto.acumulador(limite=7)
+        for x, y in zip(xs, ys):
+            acumulador.adicionar_produto(x, y)
+            assert acumulador.pendentes <= 7
+        assert acumulador.valor() == esperado
+
+
+def test_reciproco_igual_a_divisao():
+    import random
+    rng = random.Random(8)
+    for bits, precisao in [(64, 10), (3000, 5000), (20000, 20000), (9001, 30011)]:
+        n = rng.getrandbits(bits) | (1 << (bits - 1))
+        assert reciproco(n, precisao) == (1 << (bits + precisao)) // n
+    n = (1 << 20000) - 1
+    assert reciproco(n, 20000) == (1 << 40000) // n
+
+
+def test_contexto_escolha_automatica():
+    assert not ContextoModular(M521).barrett
+    from lib.ataques.rsa_franklin_reiter import backend_inteiros as backend
+    assert ContextoModular((1 << 4423) - 1).barrett == (not backend.usando_gmpy2())
+    assert contexto_para(M521) is contexto_para(M521)
+    with pytest.raises(ValueError):
+        ContextoModular(1)
@@ -0,0 +1,115 @@
+"""
+Testes unitários para as APIs assíncronas (crypto_io.assincrono e lib.ataques.assincrono).
+Executar com: pytest -v
+"""
+
+import asyncio
+import os
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from crypto_io.assincrono import (
+    ler_texto_async,
+    escrever_texto_async,
+    iterar_texto_async,
+)
+from lib.ataques.assincrono import OrquestradorAtaques
+from lib.ataques.cifra_de_Cesar.cipher import cifrar
+
+
+def test_escrever_e_ler_texto_async(tmp_path):
+    caminho = str(tmp_path / "texto.txt")
+
+    async def fluxo():
+        await escrever_texto_async(caminho, "coração " * 10)
+        blocos = [b async for b in iterar_texto_async(caminho, tamanho_bloco=4)]
+        return await ler_texto_async(caminho), "".join(blocos)
+
+    completo, em_blocos = asyncio.run(fluxo())
+    assert completo == em_blocos == "coração " * 10
+
+
+def test_iterar_texto_async_cancelado_durante_leitura(tmp_path, monkeypatch):
+    import threading
+    import time
+    from crypto_io import assincrono
+
+    fechado = threading.Event()
+
+    def blocos_lentos(*args):
+        try:
+            while True:
+                time.sleep(0.3)
+                yield "bloco"
+        finally:
+            fechado.set()
+
+    monkeypatch.setattr(assincrono, "iterar_texto", blocos_lentos)
+
+    async def fluxo():
+        async def consumir():
+            return [b async for b in iterar_texto_async("qualquer.txt")]
+
+        tarefa = asyncio.create_task(consumir())
+        await asyncio.sleep(0.1)  # a primeira leitura está em andamento
+        tarefa.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tarefa
+
+    asyncio.run(fluxo())
+    assert fechado.wait(2)
+
+
+def test_ler_texto_async_inexistente():
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(ler_texto_async("nao_existe.txt"))
+
+
+def test_orquestrador_varios_ataques_cesar():
+    textos = [cifrar("o rato roeu a roupa do rei de roma", k) for k in (1, 2, 3)]
+
+    async def fluxo():
+        async with OrquestradorAtaques(max_processos=2, max_simultaneos=2) as orq:
+            return await asyncio.gather(*(orq.ataque_cesar(t) for t in textos))
+
+    resultados = asyncio.run(fluxo())
+    assert [r["melhor_shift"] for r in resultados] == [1, 2, 3]
+    assert all(r["melhor_texto"].lower() == "o rato roeu a roupa do rei de roma" for r in resultados)
+
+
+def test_orquestrador_timeout_mantem_vaga_ate_o_fim():
+    import time
+
+    async def fluxo():
+        # pool com 2 processos, mas só 1 ataque por vez: o limite é o semáforo
+        async with OrquestradorAtaques(max_processos=2, max_simultaneos=1) as orq:
+            with pytest.raises(asyncio.TimeoutError):
+                await orq.executar(time.sleep, 0.5, timeout=0.05)
+            assert orq._semaforo.locked()
+            inicio = time.perf_counter()
+            await orq.executar(time.sleep, 0)
+            return time.perf_counter() - inicio
+
+    # o segundo só começa quando o sleep abandonado de fato termina
+    assert asyncio.run(fluxo()) > 0.3
+
+
+def test_orquestrador_trabalho_abandonado_apos_fechar_loop(caplog):
+    import time
+
+    orq = OrquestradorAtaques(max_processos=1)
+
+    async def fluxo():
+        with pytest.raises(asyncio.TimeoutError):
+            await orq.executar(time.sleep, 0.5, timeout=0.05)
+
+    asyncio.run(fluxo())  # o loop fecha com o sleep ainda rodando
+    try:
+        time.sleep(0.8)
+    finally:
+        orq.fechar()
+    # concurrent.futures registra exceções de callbacks no logging
+    assert not [r for r in caplog.records if "exception calling callback" in r.getMessage()]
@@ -0,0 +1,104 @@
+"""
+Testes unitários para backend_inteiros.py
+Executar com: pytest -v
+"""
+
+import sys
+import os
+import random
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lib.ataques.rsa_franklin_reiter import backend_inteiros as backend
+from lib.ataques.rsa_franklin_reiter.aritmetica_modular import (
+    modinv, modinv_lote, is_probable_prime, passa_teste_base_2,
+)
+from lib.ataques.rsa_franklin_reiter.mensagens_relacionadas import (
+    limpar_cache_expansao, expandir_relacao_linear, tentativa_de_recuperacao_de_mensagem,
+)
+from lib.ataques.rsa_franklin_reiter.polynomial import poly_divmod, poly_eval, poly_gcd, poly_mul
+from lib.ataques.rsa_franklin_reiter.util_rsa import generate_prime, rsa_decrypt, rsa_encrypt
+
+# primo de Mersenne 2^127 - 1 e um módulo composto com fatores grandes
+P127 = (1 << 127) - 1
+N = P127 * ((1 << 89) - 1)
+
+
+def test_backend_padrao_segue_disponibilidade():
+    esperado = backend.GMPY2 if backend.gmpy2_disponivel() else backend.PYTHON
+    with backend.usando_backend(None):
+        assert backend.backend_atual() == esperado
+
+
+def test_backend_desconhecido():
+    with pytest.raises(ValueError):
+        backend.definir_backend("fortran")
+
+
+def test_gmpy2_ausente(monkeypatch):
+    monkeypatch.setattr(backend, "gmpy2", None)
+    monkeypatch.setattr(backend, "_atual", backend.PYTHON)
+    with pytest.raises(ImportError):
+        backend.definir_backend(backend.GMPY2)
+    with backend.usando_backend(None):
+        assert backend.backend_atual() == backend.PYTHON
+
+
+def test_usando_backend_restaura():
+    anterior = backend.backend_atual()
+    with backend.usando_backend(backend.PYTHON):
+        assert backend.backend_atual() == backend.PYTHON
+    assert backend.backend_atual() == anterior
+
+
+def test_python_puro():
+    with backend.usando_backend(backend.PYTHON):
+        assert backend.potencia(3, 200, P127) == pow(3, 200, P127)
+        assert backend.inverso(12345, P127) * 12345 % P127 == 1
+        with pytest.raises(ValueError):
+            backend.inverso(6, 9)
+        assert type(backend.multiplicar(P127, P127)) is int
+
+
+def _calcular_tudo():
+    rng = random.Random(11)
+    p = [rng.randrange(N) for _ in range(60)]
+    q = [rng.randrange(N) for _ in range(25)]
+    random.seed(3)
+    primo = generate_prime(256)
+    m1, a, b, e = rng.randrange(N), 3, 7, 17
+    c1, c2 = pow(m1, e, N), pow(a * m1 + b, e, N)
+    limpar_cache_expansao()
+    return [
+        poly_mul(p, q, N),
+        poly_divmod(p, q, N),
+        poly_gcd(p, q, N),
+        poly_eval(p, 12345, N),
+        modinv(987654321, N),
+        modinv_lote(q, N),
+        is_probable_prime(P127),
+        passa_teste_base_2(N),
+        primo,
+        expandir_relacao_linear(a, b, e, c2, N),
+        tentativa_de_recuperacao_de_mensagem(c1, c2, a, b, e, N),
+        rsa_decrypt(rsa_encrypt(42, (65537, N)), (modinv(65537, (P127 - 1) * ((1 << 89) - 2)), P127, (1 << 89) - 1)),
+    ]
+
+
+def test_resultados_identicos_nos_dois_backends():
+    pytest.importorskip("gmpy2")
+    with backend.usando_backend(backend.PYTHON):
+        puro = _calcular_tudo()
+    with backend.usando_backend(backend.GMPY2):
+        rapido = _calcular_tudo()
+    assert rapido == puro
+
+    # nada de mpz vazando para quem chama
+    def tipos(valor):
+        if isinstance(valor, (list, tuple)):
+            for v in valor:
+                yield from tipos(v)
+        else:
+            yield type(valor)
+    assert set(tipos(rapido)) <= {int, bool}
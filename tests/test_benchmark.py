@@ -0,0 +1,95 @@
+"""
+Testes unitários para benchmark.py
+Executar com: pytest -v
+"""
+
+import json
+import os
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.ataques.rsa_franklin_reiter.benchmark import (
+    comparar_com_referencia,
+    executar_benchmark,
+    gerar_caso,
+    main,
+    medir,
+)
+
+
+def test_medir_aquecimento_e_preparo():
+    chamadas = []
+    tempos = medir(lambda: chamadas.append("f"), repeticoes=3, aquecimento=2,
+                   preparar=lambda: chamadas.append("p"))
+    assert chamadas == ["p", "f"] * 5
+    assert tempos["repeticoes"] == 3
+    assert 0 <= tempos["min"] <= tempos["mediana"]
+    with pytest.raises(ValueError):
+        medir(lambda: None, repeticoes=0)
+
+
+def test_gerar_caso_reproduzivel():
+    assert gerar_caso(128, 3, 1) == gerar_caso(128, 3, 1)
+    assert gerar_caso(128, 3, 1) != gerar_caso(128, 3, 2)
+
+
+def test_relatorio_por_etapa():
+    relatorio = executar_benchmark((3, 17), (128,), repeticoes=2, aquecimento=0)
+    json.dumps(relatorio)
+    por_e = {r["e"]: r for r in relatorio["resultados"]}
+    assert set(por_e) == {3, 17}
+    assert all(r["bits"] == 128 and r["correto"] for r in por_e.values())
+    assert set(por_e[3]["etapas"]) == {"expansao", "mdc", "raiz", "forma_fechada", "ataque"}
+    assert set(por_e[17]["etapas"]) == {"expansao", "mdc", "raiz", "ataque"}
+
+
+def _relatorio(mediana_mdc, correto=True):
+    tempos = lambda m: {"min": m, "mediana": m, "media": m, "repeticoes": 1}
+    return {"resultados": [{"bits": 512, "e": 3, "correto": correto,
+                            "etapas": {"expansao": tempos(1.0), "mdc": tempos(mediana_mdc)}}]}
+
+
+def test_comparar_com_referencia():
+    referencia = _relatorio(1.0)
+    assert comparar_com_referencia(_relatorio(1.2), referencia, 0.25) == []
+    regressoes = comparar_com_referencia(_relatorio(2.0), referencia, 0.25)
+    assert [(r["etapa"], r["razao"]) for r in regressoes] == [("mdc", 2.0)]
+    # casos ausentes da referência são ignorados
+    assert comparar_com_referencia(_relatorio(2.0), {"resultados": []}) == []
+
+
+def test_comparar_m1_incorreto_e_regressao():
+    regressoes = comparar_com_referencia(_relatorio(1.0, correto=False), _relatorio(1.0))
+    assert [(r["bits"], r["e"], r["motivo"]) for r in regressoes] == [(512, 3, "incorreto")]
+
+
+def test_comparar_ambientes_diferentes():
+    atual, referencia = _relatorio(1.0), _relatorio(1.0)
+    atual["backend"], referencia["backend"] = "gmpy2", "python"
+    with pytest.raises(ValueError, match="backend"):
+        comparar_com_referencia(atual, referencia)
+    assert comparar_com_referencia(atual, referencia, ignorar_ambiente=True) == []
+
+
+def test_cli_grava_e_compara(tmp_path, capsys):
+    saida = tmp_path / "atual.json"
+    assert main(["-e", "3", "-b", "128", "-r", "1", "-w", "0", "-o", str(saida)]) == 0
+    relatorio = json.loads(saida.read_text())
+    assert relatorio["resultados"][0]["e"] == 3
+
+    lenta = tmp_path / "referencia.json"
+    for etapa in relatorio["resultados"][0]["etapas"].values():
+        etapa["mediana"] = 1e-12
+    lenta.write_text(json.dumps(relatorio))
+    assert main(["-e", "3", "-b", "128", "-r", "1", "--referencia", str(lenta)]) == 1
+    assert "REGRESSÃO" in capsys.readouterr().out
+
+    relatorio["python"] = "0.0.0"
+    lenta.write_text(json.dumps(relatorio))
+    assert main(["-e", "3", "-b", "128", "-r", "1", "--referencia", str(lenta)]) == 2
+    assert "python: 0.0.0" in capsys.readouterr().err
+    assert main(["-e", "3", "-b", "128", "-r", "1", "--referencia", str(lenta), "--ignorar-ambiente"]) == 1
+    assert "AVISO" in capsys.readouterr().out
@@ -0,0 +1,54 @@
+"""
+Testes unitários para blocos_rsa.py
+Executar com: pytest -v
+"""
+
+import os
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from crypto_io import (
+    tamanho_bloco_para_modulo,
+    bytes_para_blocos,
+    texto_para_blocos,
+    blocos_para_bytes,
+    blocos_para_texto,
+)
+
+N_512 = (1 << 511) + 187  # só o tamanho importa para os blocos
+
+
+def test_tamanho_bloco_para_modulo():
+    assert tamanho_bloco_para_modulo(256) == 1
+    assert tamanho_bloco_para_modulo(N_512) == 63
+
+
+def test_blocos_menores_que_n():
+    blocos = texto_para_blocos("ÿ" * 500, N_512)
+    assert len(blocos) == -(-1000 // 63)
+    assert all(m < N_512 for m in blocos)
+
+
+def test_texto_longo_ida_e_volta():
+    texto = "Franklin–Reiter com acentuação: ção " * 200
+    blocos = texto_para_blocos(texto, N_512)
+    assert blocos_para_texto(blocos, N_512, blocos.tamanho_total) == texto
+
+
+def test_lotes_e_indices():
+    blocos = bytes_para_blocos(b"\x01\x02\x03\x04\x05", 2)
+    assert list(blocos) == [0x0102, 0x0304, 0x05]
+    assert blocos[-1] == 0x05
+    assert list(blocos.lotes(2)) == [[0x0102, 0x0304], [0x05]]
+    with pytest.raises(IndexError):
+        blocos[3]
+
+
+def test_blocos_para_bytes_quantidade_inconsistente():
+    with pytest.raises(ValueError):
+        blocos_para_bytes([1, 2], 2, 6)
+    with pytest.raises(ValueError):
+        blocos_para_bytes([1, 2, 3], 2, 3)
@@ -0,0 +1,154 @@
+"""
+Testes unitários para cifra_em_blocos.py
+Executar com: pytest -v
+"""
+
+import base64
+import os
+import random
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.ataques.rsa_franklin_reiter.cifra_em_blocos import (
+    CABECALHO,
+    algoritmo_rsa_em_blocos,
+    cifrar_arquivo_em_blocos,
+    cifrar_em_blocos,
+    decifrar_arquivo_em_blocos,
+    decifrar_em_blocos,
+    iterar_decifrado,
+)
+from lib.ataques.rsa_franklin_reiter.pool_chaves import gerar_chave_completa
+from lib.ataques.rsa_franklin_reiter.util_rsa import rsa_encrypt
+from crypto_io.blocos_rsa import tamanho_bloco_para_modulo
+
+TEXTO = "Minha terra tem palmeiras, onde canta o sabiá; " * 40 + "ção ü ✓"
+
+
+@pytest.fixture(scope="module")
+def chaves():
+    n, e, d, p, q = gerar_chave_completa(256, 65537, random.Random(5))
+    return (e, n), (d, p, q)
+
+
+def test_ida_e_volta_texto_longo(chaves):
+    publica, privada = chaves
+    container = cifrar_em_blocos(TEXTO, publica)
+    assert decifrar_em_blocos(container, privada).decode("utf-8") == TEXTO
+
+
+def test_formato_blocos_largura_fixa(chaves):
+    (e, n), privada = chaves
+    k = tamanho_bloco_para_modulo(n)
+    largura = (n.bit_length() + 7) // 8
+    dados = bytes(range(256)) * 3
+    container = cifrar_em_blocos(dados, (e, n))
+    assert len(container) == CABECALHO.size + -(-len(dados) // k) * largura
+    primeiro = int.from_bytes(container[CABECALHO.size:CABECALHO.size + largura], "big")
+    assert primeiro == rsa_encrypt(int.from_bytes(dados[:k], "big"), (e, n))
+
+
+@pytest.mark.parametrize("tamanho", [0, 1, 63, 64, 65, 640])
+def test_tamanhos_de_borda(chaves, tamanho):
+    publica, privada = chaves
+    dados = bytes(random.Random(tamanho).getrandbits(8) for _ in range(tamanho))
+    assert decifrar_em_blocos(cifrar_em_blocos(dados, publica, tamanho_lote=3), privada) == dados
+
+
+def test_decifrar_em_fluxo_por_lotes(chaves):
+    publica, privada = chaves
+    container = cifrar_em_blocos(TEXTO, publica)
+    pedacos = list(iterar_decifrado(container, privada, tamanho_lote=4))
+    assert len(pedacos) > 1
+    assert b"".join(pedacos).decode("utf-8") == TEXTO
+
+
+def test_arquivos(tmp_path, chaves):
+    publica, privada = chaves
+    origem, cifrado, volta = tmp_path / "claro.txt", tmp_path / "claro.rsa", tmp_path / "volta.txt"
+    origem.write_text(TEXTO, encoding="utf-8")
+    gravados = cifrar_arquivo_em_blocos(str(origem), str(cifrado), publica, tamanho_lote=5)
+    assert gravados == cifrado.stat().st_size
+    assert cifrado.read_bytes() == cifrar_em_blocos(TEXTO, publica)
+    assert decifrar_arquivo_em_blocos(str(cifrado), str(volta), privada) == origem.stat().st_size
+    assert volta.read_text(encoding="utf-8") == TEXTO
+
+
+def test_arquivo_sem_destino_parcial_em_erro(tmp_path, chaves):
+    publica, privada = chaves
+    cifrado, volta = tmp_path / "claro.rsa", tmp_path / "volta.txt"
+    cifrado.write_bytes(cifrar_em_blocos(TEXTO, publica)[:-1])
+    with pytest.raises(ValueError):
+        decifrar_arquivo_em_blocos(str(cifrado), str(volta), privada)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["claro.rsa"]
+
+
+def test_erro_de_escrita_nao_e_mascarado(tmp_path, chaves, monkeypatch):
+    import errno
+    import builtins
+    from lib.ataques.rsa_franklin_reiter import cifra_em_blocos
+
+    class DiscoCheio:
+        def __init__(self, caminho, modo):
+            self.arquivo = builtins.open(caminho, modo)
+
+        def write(self, dados):
+            raise OSError(errno.ENOSPC, "Sem espaço no dispositivo")
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.arquivo.close()
+
+    publica, _ = chaves
+    origem = tmp_path / "claro.txt"
+    origem.write_text(TEXTO, encoding="utf-8")
+    monkeypatch.setattr(cifra_em_blocos, "open", DiscoCheio, raising=False)
+    with pytest.raises(OSError) as erro:
+        cifrar_arquivo_em_blocos(str(origem), str(tmp_path / "claro.rsa"), publica, tamanho_lote=2)
+    assert erro.value.errno == errno.ENOSPC
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["claro.txt"]
+
+
+def test_pool_igual_ao_serial(chaves):
+    publica, privada = chaves
+    container = cifrar_em_blocos(TEXTO, publica, processes=2, tamanho_lote=16)
+    assert container == cifrar_em_blocos(TEXTO, publica)
+    assert decifrar_em_blocos(container, privada, processes=2).decode("utf-8") == TEXTO
+
+
+def test_conteineres_invalidos(chaves):
+    publica, privada = chaves
+    container = cifrar_em_blocos(TEXTO, publica)
+    with pytest.raises(ValueError):
+        decifrar_em_blocos(b"XXXXXXXX" + container[8:], privada)
+    with pytest.raises(ValueError):
+        decifrar_em_blocos(container[:-1], privada)
+    with pytest.raises(ValueError):
+        decifrar_em_blocos(container + b"\0", privada)
+    n, e, d, p, q = gerar_chave_completa(200, 65537, random.Random(6))
+    with pytest.raises(ValueError):
+        decifrar_em_blocos(container, (d, p, q))
+    n, e, d, p, q = gerar_chave_completa(256, 65537, random.Random(6))
+    with pytest.raises(ValueError, match="não corresponde"):
+        decifrar_em_blocos(container, (d, p, q))
+
+
+def test_algoritmo_para_comparacao(chaves):
+    from lib.estatisticas import comparar_algoritmos
+
+    publica, privada = chaves
+    rsa = algoritmo_rsa_em_blocos(publica, privada)
+    cifrado = rsa["cifrar"](TEXTO)
+    base64.b64decode(cifrado, validate=True)
+    assert rsa["decifrar"](cifrado) == TEXTO
+
+    resultados = comparar_algoritmos({"longo": TEXTO}, {"RSA": rsa}, max_shift_auto=5)
+    linha = resultados["RSA"]["longo"]
+    assert linha["tamanho"] == len(TEXTO.encode("utf-8"))
+    assert linha["tempo_ataque"] is None
+    assert linha["expansao"] > 1
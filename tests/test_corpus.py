@@ -0,0 +1,104 @@
+"""
+Testes unitários para corpus.py
+Executar com: pytest -v
+"""
+
+import os
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from crypto_io import (
+    Corpus,
+    carregar_corpus,
+    histograma_letras,
+    escrever_texto,
+)
+from crypto_io.corpus import NOME_INDICE
+
+
+def test_histograma_letras_soma_acentuadas():
+    assert histograma_letras("Ação aé!") == {"A": 3, "C": 1, "E": 1, "O": 1}
+
+
+def test_carregar_corpus_acesso_por_nome(tmp_path):
+    escrever_texto(str(tmp_path / "um.txt"), "abc")
+    escrever_texto(str(tmp_path / "dois.txt"), "Olá")
+    escrever_texto(str(tmp_path / "ignorado.md"), "x")
+
+    corpus = carregar_corpus(str(tmp_path), max_workers=2)
+
+    assert sorted(corpus) == ["dois", "um"]
+    assert corpus["dois"] == "Olá"
+    assert corpus.histograma("um") == {"A": 1, "B": 1, "C": 1}
+    assert corpus.metadados("um")["tamanho"] == 3
+    assert (tmp_path / NOME_INDICE).exists()
+
+
+def test_corpus_reaproveita_indice(tmp_path, monkeypatch):
+    escrever_texto(str(tmp_path / "um.txt"), "abc")
+    carregar_corpus(str(tmp_path))
+
+    def falha(*args, **kwargs):
+        raise AssertionError("arquivo não deveria ser relido")
+
+    monkeypatch.setattr("crypto_io.corpus._descrever_arquivo", falha)
+    corpus = carregar_corpus(str(tmp_path))
+    assert corpus.histograma("um") == {"A": 1, "B": 1, "C": 1}
+
+
+def test_corpus_recalcula_arquivo_modificado(tmp_path):
+    caminho = tmp_path / "um.txt"
+    escrever_texto(str(caminho), "abc")
+    carregar_corpus(str(tmp_path))
+
+    escrever_texto(str(caminho), "zzzz")
+    os.utime(caminho, ns=(0, 1))
+    corpus = carregar_corpus(str(tmp_path))
+    assert corpus.histograma("um") == {"Z": 4}
+
+
+def test_corpus_padrao_amplo_ignora_indice(tmp_path):
+    escrever_texto(str(tmp_path / "um.txt"), "abc")
+    escrever_texto(str(tmp_path / (NOME_INDICE + ".tmp")), "{")
+    carregar_corpus(str(tmp_path))
+    corpus = carregar_corpus(str(tmp_path), padrao="*")
+    assert list(corpus) == ["um"]
+
+
+def test_corpus_sem_permissao_para_indice(tmp_path, monkeypatch):
+    escrever_texto(str(tmp_path / "um.txt"), "abc")
+
+    def falha(*args, **kwargs):
+        raise PermissionError("somente leitura")
+
+    monkeypatch.setattr(os, "replace", falha)
+    corpus = carregar_corpus(str(tmp_path))
+    assert corpus.histograma("um") == {"A": 1, "B": 1, "C": 1}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["um.txt"]
+
+
+def test_corpus_arquivo_alterado_durante_leitura(tmp_path, monkeypatch):
+    from crypto_io import corpus as modulo
+    caminho = tmp_path / "um.txt"
+    escrever_texto(str(caminho), "abc")
+    ler_original = modulo.ler_bytes
+
+    def ler_e_alterar(c):
+        dados = ler_original(c)
+        escrever_texto(c, "zzzz")  # outro processo grava logo após a leitura
+        os.utime(c, ns=(0, 10**9))
+        return dados
+
+    monkeypatch.setattr(modulo, "ler_bytes", ler_e_alterar)
+    carregar_corpus(str(tmp_path))
+    monkeypatch.setattr(modulo, "ler_bytes", ler_original)
+    # o índice não pode ter guardado o stat novo com o histograma antigo
+    assert carregar_corpus(str(tmp_path)).histograma("um") == {"Z": 4}
+
+
+def test_corpus_diretorio_inexistente(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Corpus(str(tmp_path / "nao_existe"))
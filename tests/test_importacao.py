@@ -0,0 +1,79 @@
+"""
+Testes de importação preguiçosa dos pacotes
+Executar com: pytest -v
+"""
+
+import json
+import subprocess
+import sys
+import os
+import pytest
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, RAIZ)
+
+PACOTES = [
+    "crypto_io",
+    "lib.estatisticas",
+    "lib.ataques.analise_de_frequencia",
+    "lib.ataques.cifra_de_Cesar",
+    "lib.ataques.rsa_franklin_reiter",
+]
+
+PESADOS = ["argparse", "concurrent.futures", "sympy", "numpy", "asyncio"]
+
+# carregado por todos os pacotes para montar __getattr__/__dir__
+AUXILIAR = "crypto_io._importacao"
+
+
+def _executar(codigo: str, *opcoes: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *opcoes, "-c", codigo], cwd=RAIZ,
+                          capture_output=True, text=True, check=True)
+
+
+@pytest.mark.parametrize("pacote", PACOTES)
+def test_importar_pacote_nao_carrega_submodulos(pacote):
+    codigo = (
+        f"import sys, {pacote}\n"
+        f"print(sorted(m for m in sys.modules if m.startswith('{pacote}.') and m != '{AUXILIAR}'))\n"
+        f"print([m for m in {PESADOS!r} if m in sys.modules])\n"
+    )
+    submodulos, pesados = _executar(codigo).stdout.splitlines()
+    assert submodulos == "[]"
+    assert pesados == "[]"
+
+
+@pytest.mark.parametrize("pacote", PACOTES)
+def test_nomes_exportados_resolvem(pacote):
+    import importlib
+    import types
+    modulo = importlib.import_module(pacote)
+    # importa os submódulos antes: um nome igual ao de um submódulo seria
+    # sobrescrito pelo próprio submódulo e __getattr__ nunca rodaria
+    origens = {nome: importlib.import_module(sub, pacote) for nome, sub in modulo._EXPORTACOES.items()}
+    for nome in modulo.__all__:
+        valor = getattr(modulo, nome)
+        assert not isinstance(valor, types.ModuleType), nome
+        assert valor is getattr(origens[nome], nome)
+        assert nome in dir(modulo)
+
+
+def test_nome_inexistente_lanca_attribute_error():
+    import lib.ataques.cifra_de_Cesar as cesar
+    with pytest.raises(AttributeError):
+        cesar.nao_existe
+
+
+def test_cli_cesar_nao_carrega_modulos_pesados():
+    codigo = (
+        "import json, sys, lib.ataques.cifra_de_Cesar.cli\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith(('lib', 'crypto_io')))))\n"
+        f"print(json.dumps([m for m in {PESADOS!r} if m in sys.modules]))\n"
+    )
+    carregados, pesados = _executar(codigo).stdout.splitlines()
+    assert json.loads(carregados) == [
+        "crypto_io", AUXILIAR, "crypto_io.util_io",
+        "lib", "lib.ataques", "lib.ataques.cifra_de_Cesar",
+        "lib.ataques.cifra_de_Cesar.cipher", "lib.ataques.cifra_de_Cesar.cli",
+    ]
+    assert json.loads(pesados) == ["argparse"]
@@ -0,0 +1,103 @@
+"""
+Testes unitários para lote_casos.py
+Executar com: pytest -v
+"""
+
+import os
+import random
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.ataques.rsa_franklin_reiter.lote_casos import (
+    MODOS,
+    gerar_bloco_de_casos,
+    gerar_casos_em_lote,
+    iterar_casos,
+)
+from lib.ataques.rsa_franklin_reiter.pool_chaves import gerar_chave_completa
+from lib.ataques.rsa_franklin_reiter.util_rsa import generate_prime
+from crypto_io.util_io import inteiro_para_texto
+
+GRADE = dict(bits=(64, 96), expoentes=(3, 5), modos=MODOS, semente=7, tamanho_bloco=3)
+
+
+def _caso_valido(caso):
+    n, e = caso["n"], caso["e"]
+    assert caso["m2"] == (caso["a"] * caso["m1"] + caso["b"]) % n
+    assert caso["c1"] == pow(caso["m1"], e, n)
+    assert caso["c2"] == pow(caso["m2"], e, n)
+    assert pow(caso["c1"], caso["d"], n) == caso["m1"]
+
+
+def test_rng_torna_primos_e_chaves_reproduziveis():
+    assert generate_prime(128, random.Random(1)) == generate_prime(128, random.Random(1))
+    assert gerar_chave_completa(64, 3, random.Random(2)) == gerar_chave_completa(64, 3, random.Random(2))
+
+
+def test_bloco_reproduzivel_e_valido():
+    casos = gerar_bloco_de_casos(64, 3, "texto", 1, 0, 0, 4)
+    assert casos == gerar_bloco_de_casos(64, 3, "texto", 1, 0, 0, 4)
+    assert casos != gerar_bloco_de_casos(64, 3, "texto", 2, 0, 0, 4)
+    for caso in casos:
+        _caso_valido(caso)
+        assert inteiro_para_texto(caso["m1"], caso["nbytes"]).isprintable()
+
+
+def test_casos_por_chave_reaproveita_chave():
+    casos = gerar_bloco_de_casos(64, 3, "deslocamento", 0, 0, 0, 4, casos_por_chave=2)
+    assert casos[0]["n"] == casos[1]["n"] != casos[2]["n"] == casos[3]["n"]
+    assert all(c["a"] == 1 for c in casos)
+
+
+def test_modo_invalido():
+    with pytest.raises(ValueError):
+        gerar_bloco_de_casos(64, 3, "outro", 0, 0, 0, 1)
+
+
+@pytest.mark.parametrize("nome", ["casos.jsonl", "casos.bin"])
+def test_arquivo_em_grade_e_leitura(tmp_path, nome):
+    caminho = str(tmp_path / nome)
+    total = gerar_casos_em_lote(caminho, 5, **GRADE)
+    casos = list(iterar_casos(caminho))
+    assert total == len(casos) == 2 * 2 * len(MODOS) * 5
+    assert [c["indice"] for c in casos[:5]] == list(range(5))
+    assert {(c["bits"], c["e"], c["modo"]) for c in casos} == {
+        (b, e, m) for b in (64, 96) for e in (3, 5) for m in MODOS
+    }
+    for caso in casos:
+        _caso_valido(caso)
+        assert (caso["nbytes"] is not None) == (caso["modo"] == "texto")
+
+
+def test_formatos_guardam_os_mesmos_casos(tmp_path):
+    gerar_casos_em_lote(str(tmp_path / "a.jsonl"), 3, **GRADE)
+    gerar_casos_em_lote(str(tmp_path / "a.bin"), 3, **GRADE)
+    assert list(iterar_casos(str(tmp_path / "a.jsonl"))) == list(iterar_casos(str(tmp_path / "a.bin")))
+
+
+def test_pool_gera_o_mesmo_arquivo(tmp_path):
+    serial, pool = tmp_path / "serial.bin", tmp_path / "pool.bin"
+    gerar_casos_em_lote(str(serial), 4, **GRADE)
+    gerar_casos_em_lote(str(pool), 4, processes=2, **GRADE)
+    assert serial.read_bytes() == pool.read_bytes()
+
+
+def test_leitura_sob_demanda(tmp_path):
+    caminho = str(tmp_path / "casos.bin")
+    gerar_casos_em_lote(caminho, 2, bits=(64,))
+    leitor = iterar_casos(caminho)
+    assert next(leitor)["indice"] == 0
+    assert next(leitor)["indice"] == 1
+    with pytest.raises(StopIteration):
+        next(leitor)
+
+
+def test_arquivo_truncado(tmp_path):
+    caminho = tmp_path / "casos.bin"
+    gerar_casos_em_lote(str(caminho), 1, bits=(64,))
+    caminho.write_bytes(caminho.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        list(iterar_casos(str(caminho)))
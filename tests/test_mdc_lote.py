@@ -0,0 +1,100 @@
+"""
+Testes unitários para mdc_lote.py
+Executar com: pytest -v
+"""
+
+import json
+import os
+import random
+import sys
+from math import gcd, prod
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.ataques.rsa_franklin_reiter.mdc_lote import (
+    arvore_de_produtos,
+    arvore_de_restos,
+    fatorar_modulos_compartilhados,
+    ler_modulos,
+    main,
+    mdc_em_lote,
+)
+from lib.ataques.rsa_franklin_reiter.lote_casos import gerar_casos_em_lote
+from lib.ataques.rsa_franklin_reiter.util_rsa import generate_prime
+
+
+@pytest.fixture(scope="module")
+def modulos():
+    """40 módulos de 256 bits; 3, 17, 30 e 35 compartilham primos, 25 repete 8."""
+    rng = random.Random(11)
+    primos = [generate_prime(128, rng) for _ in range(80)]
+    modulos = [primos[2 * i] * primos[2 * i + 1] for i in range(40)]
+    modulos[17] = primos[6] * primos[70]   # divide primos[6] com o 3
+    modulos[30] = primos[7] * primos[71]   # divide primos[7] com o 3 (e 71 com o 35)
+    modulos[25] = modulos[8]               # repetido, sem primo em comum com outro
+    return modulos
+
+
+def test_restos_iguais_aos_diretos():
+    rng = random.Random(2)
+    for k in (1, 2, 3, 7, 16):
+        nums = [rng.getrandbits(rng.choice((64, 300, 1000))) | 1 for _ in range(k)]
+        niveis = arvore_de_produtos(nums)
+        assert niveis[-1] == [prod(nums)]
+        assert arvore_de_restos(niveis) == [prod(nums) % (n * n) for n in nums]
+
+
+def test_mdc_em_lote_igual_a_par_a_par(modulos):
+    esperado = [gcd(n, prod(modulos[:i] + modulos[i + 1:])) for i, n in enumerate(modulos)]
+    assert mdc_em_lote(modulos) == esperado
+    assert mdc_em_lote([]) == []
+
+
+def test_fatorar_modulos_compartilhados(modulos):
+    fatoradas = fatorar_modulos_compartilhados(modulos)
+    assert [i for i, *_ in fatoradas] == [3, 17, 30, 35]
+    for i, n, p, q in fatoradas:
+        assert n == modulos[i] == p * q and 1 < p <= q
+
+
+def test_fatorar_modulos_repetidos(modulos, monkeypatch):
+    from lib.ataques.rsa_franklin_reiter import mdc_lote as modulo
+    chamadas = []
+    original = modulo._fator_por_pares
+    monkeypatch.setattr(modulo, "_fator_por_pares",
+                        lambda i, ms: chamadas.append(len(ms)) or original(i, ms))
+    # 3 repetido: todas as cópias são fatoradas, com o mdc sobre módulos únicos
+    repetidos = modulos + [modulos[3]] * 50 + [modulos[8]] * 50
+    fatoradas = fatorar_modulos_compartilhados(repetidos)
+    assert [i for i, *_ in fatoradas] == [3, 17, 30, 35] + list(range(40, 90))
+    assert {(n, p, q) for _, n, p, q in fatoradas if n == modulos[3]} == {fatoradas[0][1:]}
+    assert chamadas == [39] * 4  # par a par só sobre os 39 módulos únicos
+
+
+def test_pool_igual_ao_serial(modulos):
+    assert mdc_em_lote(modulos, processes=2) == mdc_em_lote(modulos)
+
+
+def test_ler_modulos_formatos(tmp_path, modulos):
+    texto = tmp_path / "modulos.txt"
+    texto.write_text("# dump\n\n" + "\n".join(f"{n:#x}" if i % 2 else str(n) for i, n in enumerate(modulos[:4])) + "\n")
+    assert list(ler_modulos(str(texto))) == modulos[:4]
+
+    jsonl = tmp_path / "chaves.jsonl"
+    jsonl.write_text("".join(json.dumps({"n": n, "e": 3}) + "\n" for n in modulos[:3]))
+    assert list(ler_modulos(str(jsonl))) == modulos[:3]
+
+    casos = tmp_path / "casos.bin"
+    gerar_casos_em_lote(str(casos), 3, bits=(64,))
+    assert len(list(ler_modulos(str(casos)))) == 3
+
+
+def test_cli(tmp_path, capsys, modulos):
+    arquivo = tmp_path / "modulos.txt"
+    arquivo.write_text("\n".join(map(str, modulos)))
+    assert main([str(arquivo)]) == 1
+    assert "4 de 40 módulos fatorados." in capsys.readouterr().out
+    arquivo.write_text("\n".join(map(str, modulos[:3])))
+    assert main([str(arquivo)]) == 0
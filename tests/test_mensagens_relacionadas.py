@@ -14,8 +14,14 @@ from lib.ataques.rsa_franklin_reiter.mensagens_relacionadas import (
     expandir_relacao_linear,
     construir_polinomio_para_cifra,
     construir_polinomio_de_relacao,
-    tentativa_de_recuperacao_de_mensagem
+    tentativa_de_recuperacao_de_mensagem,
+    raiz_de_polinomio_linear,
+    recuperar_mensagens_em_lote,
+    recuperar_mensagem_forma_fechada,
+    limpar_cache_expansao,
+    _expansao_em_cache,
 )
+from lib.ataques.rsa_franklin_reiter.ataque import ataque_franklin_reiter_lote
 from lib.ataques.rsa_franklin_reiter.polynomial import poly_eval
 
 
@@ -62,6 +68,40 @@ class TestExpandirRelacaoLinear:
         coefs = expandir_relacao_linear(a=1, b=0, e=0, c=1, n=None)
         assert coefs == [0]
 
+    def test_expansao_igual_a_formula_binomial(self):
+        """Compara a recorrência com comb(e,k) * a^k * b^(e-k), com e sem inversos mod n"""
+        from math import comb
+        for n in (1_000_003, 2 * 3 * 5 * 7, None):
+            a, b, e, c = 12345, 678, 23, 9
+            esperado = [comb(e, k) * a**k * b**(e - k) for k in range(e + 1)]
+            esperado[0] -= c
+            if n is not None:
+                esperado = [x % n for x in esperado]
+            assert expandir_relacao_linear(a, b, e, c, n) == esperado
+
+    def test_expansao_b_zero(self):
+        """(3x + 0)^3 - 1 mod 7 = 27x^3 - 1"""
+        assert expandir_relacao_linear(a=3, b=0, e=3, c=1, n=7) == [6, 0, 0, 27 % 7]
+
+    def test_cache_nao_compartilha_lista(self):
+        """Chamadas repetidas usam o cache mas devolvem listas independentes"""
+        primeira = expandir_relacao_linear(a=2, b=3, e=5, c=1, n=101)
+        primeira[1] = -1
+        segunda = expandir_relacao_linear(a=2, b=3, e=5, c=4, n=101)
+        assert segunda[1] != -1
+        assert segunda[0] == (primeira[0] - 3) % 101
+
+    def test_cache_limitado_e_sem_monomios(self):
+        """b = 0 não ocupa o cache, que guarda só as últimas expansões"""
+        limpar_cache_expansao()
+        expandir_relacao_linear(a=1, b=0, e=65537, c=5, n=2**127 - 1)
+        assert _expansao_em_cache.cache_info().currsize == 0
+        for b in range(1, 5):
+            expandir_relacao_linear(a=2, b=b, e=7, c=1, n=101)
+        assert _expansao_em_cache.cache_info().currsize == 2
+        limpar_cache_expansao()
+        assert _expansao_em_cache.cache_info().currsize == 0
+
 
 class TestConstruirPolinomioParaCifra:
     """Testa construir_polinomio_para_cifra"""
@@ -269,4 +309,111 @@ class TestIntegracaoFranklinReiter:
         g_coefs_2 = construir_polinomio_de_relacao(a, b, e, c2, n)
         
         # deve ser o mesmo resultado depois de redução modular
-        assert [c % n for c in g_coefs_1] == g_coefs_2
\ No newline at end of file
+        assert [c % n for c in g_coefs_1] == g_coefs_2
+
+class TestRecuperacaoModular:
+    """Testa o caminho modular (sem SymPy) do Franklin–Reiter"""
+
+    # n = 1009 * 1013, e = 5 (coprimo de phi)
+    P, Q = 1009, 1013
+    N = P * Q
+    E = 5
+
+    def _caso(self, m1, a, b):
+        m2 = (a * m1 + b) % self.N
+        return pow(m1, self.E, self.N), pow(m2, self.E, self.N)
+
+    def test_recupera_m1(self):
+        m1, a, b = 123456, 7, 99
+        c1, c2 = self._caso(m1, a, b)
+        assert tentativa_de_recuperacao_de_mensagem(c1, c2, a, b, self.E, self.N) == m1
+
+    def test_relacao_trivial_falha(self):
+        # a=1, b=0: f1 == f2, gcd não é linear
+        m1 = 4242
+        c1, c2 = self._caso(m1, 1, 0)
+        assert tentativa_de_recuperacao_de_mensagem(c1, c2, 1, 0, self.E, self.N) is None
+
+    def test_raiz_de_polinomio_linear(self):
+        assert raiz_de_polinomio_linear([-2 % 7, 1], 7) == 2
+        assert raiz_de_polinomio_linear([1, 2, 3], 7) is None
+
+    def test_verificacao_com_sympy(self):
+        pytest.importorskip("sympy")
+        m1, a, b = 98765, 3, 11
+        c1, c2 = self._caso(m1, a, b)
+        assert tentativa_de_recuperacao_de_mensagem(c1, c2, a, b, self.E, self.N, verificar_com_sympy=True) == m1
+
+    def test_recupera_em_lote(self):
+        a, b = 7, 99
+        mensagens = [123456, 4242, 98765, 1]
+        pares = [self._caso(m1, a, b) for m1 in mensagens]
+        assert list(recuperar_mensagens_em_lote(pares, a, b, self.E, self.N)) == mensagens
+
+    def test_lote_com_par_invalido(self):
+        a, b = 7, 99
+        c1, c2 = self._caso(555, a, b)
+        pares = [(c1, c2), (c1, (c2 + 1) % self.N)]
+        assert list(recuperar_mensagens_em_lote(pares, a, b, self.E, self.N)) == [555, None]
+
+
+class TestFormaFechada:
+    """Testa as fórmulas fechadas para e = 3, 5 e 7"""
+
+    # 1012 = 4*11*23 e 1018 = 2*509: e = 3, 5, 7 são coprimos de phi
+    N = 1013 * 1019
+
+    @pytest.mark.parametrize("e", [3, 5, 7])
+    def test_recupera_m1(self, e):
+        import random
+        rng = random.Random(e)
+        for _ in range(20):
+            m1, a, b = rng.randrange(self.N), rng.randrange(1, self.N), rng.randrange(1, self.N)
+            c1, c2 = pow(m1, e, self.N), pow(a * m1 + b, e, self.N)
+            resultado = recuperar_mensagem_forma_fechada(c1, c2, a, b, e, self.N)
+            assert resultado == m1
+            assert tentativa_de_recuperacao_de_mensagem(c1, c2, a, b, e, self.N) == m1
+
+    def test_relacao_conhecida(self):
+        m1, a, b = 31337, 2, 5
+        c1, c2 = pow(m1, 3, self.N), pow(a * m1 + b, 3, self.N)
+        assert recuperar_mensagem_forma_fechada(c1, c2, a, b, 3, self.N) == m1
+
+    def test_sem_formula_ou_b_zero(self):
+        m1 = 4242
+        c1 = pow(m1, 3, self.N)
+        assert recuperar_mensagem_forma_fechada(c1, pow(m1, 3, self.N), 1, 0, 3, self.N) is None
+        assert recuperar_mensagem_forma_fechada(1, 2, 1, 1, 17, self.N) is None
+
+
+class TestAtaqueEmLote:
+    """Testa ataque_franklin_reiter_lote (em série e num pool de processos)"""
+
+    N = 1009 * 1013
+    E = 5
+    A, B = 3, 11
+
+    def _pares(self, mensagens):
+        return [(pow(m, self.E, self.N), pow(self.A * m + self.B, self.E, self.N)) for m in mensagens]
+
+    def test_em_serie(self):
+        mensagens = [ord("o") * 256 + ord("i"), 12345]
+        resultados = list(ataque_franklin_reiter_lote(self._pares(mensagens), self.E, self.N,
+                                                      self.A, self.B, nbytes=2))
+        assert [m1 for m1, _, _ in resultados] == mensagens
+        assert resultados[0][1] == "oi"
+        assert all(tempo >= 0 for _, _, tempo in resultados)
+
+    def test_par_sem_texto_nao_interrompe_lote(self):
+        """m1 que não é UTF-8 (0xffff) ou não cabe em nbytes (70000) sai com texto None"""
+        mensagens = [ord("o") * 256 + ord("i"), 0xFFFF, 70000, ord("a") * 256 + ord("b")]
+        resultados = list(ataque_franklin_reiter_lote(self._pares(mensagens), self.E, self.N,
+                                                      self.A, self.B, nbytes=2))
+        assert [m1 for m1, _, _ in resultados] == mensagens
+        assert [texto for _, texto, _ in resultados] == ["oi", None, None, "ab"]
+
+    def test_em_processos_mantem_ordem(self):
+        mensagens = list(range(1000, 1040))
+        resultados = ataque_franklin_reiter_lote(self._pares(mensagens), self.E, self.N, self.A, self.B,
+                                                 processes=2, tamanho_fatia=7)
+        assert [m1 for m1, texto, _ in resultados] == mensagens
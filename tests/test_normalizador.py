@@ -14,6 +14,8 @@ from crypto_io import (
     remover_acentos,
     somente_letras,
     normalizar_texto,
+    normalizar_fluxo,
+    somente_letras_fluxo,
 )
 
 
@@ -55,4 +57,29 @@ def test_normalizar_texto_caracteres_invalidos():
 
 def test_normalizar_texto_complexo():
     alfabeto = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-    assert normalizar_texto('ÁrVoRe ÓTIMA!!! 123', alfabeto) == 'ARVOREOTIMA'
\ No newline at end of file
+    assert normalizar_texto('ÁrVoRe ÓTIMA!!! 123', alfabeto) == 'ARVOREOTIMA'
+
+def test_normalizar_fluxo_equivale_ao_texto_completo():
+    texto = 'Ação, coração e PINGÜIM!'
+    blocos = [texto[i:i + 3] for i in range(0, len(texto), 3)]
+    assert ''.join(normalizar_fluxo(blocos)) == normalizar_texto(texto)
+
+
+def test_normalizar_fluxo_marca_combinante_no_proximo_bloco():
+    # 'e' + acento agudo combinante separados entre blocos
+    blocos = ['cafe', '\u0301 ', 'ok']
+    assert ''.join(normalizar_fluxo(blocos)) == 'CAFE OK'
+
+
+def test_normalizar_fluxo_bytes_utf8_cortados():
+    dados = 'coração'.encode('utf-8')
+    blocos = [dados[i:i + 1] for i in range(len(dados))]
+    assert ''.join(normalizar_fluxo(blocos)) == 'CORACAO'
+
+
+def test_somente_letras_fluxo_arquivo(tmp_path):
+    caminho = tmp_path / 'texto.txt'
+    caminho.write_text('Olá, mundo!', encoding='utf-8')
+    with open(caminho, 'r', encoding='utf-8') as f:
+        resultado = ''.join(somente_letras_fluxo(f, 'OLAMUNDO', tamanho_bloco=2))
+    assert resultado == 'OLAMUNDO'
@@ -11,7 +11,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from lib.ataques.rsa_franklin_reiter.polynomial import (
     poly_normalize, poly_add, poly_mul,
-    poly_eval, poly_divmod, poly_gcd
+    poly_eval, poly_divmod, poly_gcd, PolinomioModN
 )
 
 
@@ -88,3 +88,215 @@ def test_poly_gcd_com_zero():
 
 def test_poly_gcd_zero_reverso():
     assert poly_gcd([0], [1, 2]) == [1, 2]
+
+
+def _mul_referencia(p, q, n):
+    resultado = [0] * (len(p) + len(q) - 1)
+    for i in range(len(p)):
+        for j in range(len(q)):
+            resultado[i + j] = (resultado[i + j] + p[i] * q[j]) % n
+    return poly_normalize(resultado, n)
+
+
+def test_poly_mul_modular_kronecker_igual_ao_escolar():
+    import random
+    rng = random.Random(1)
+    n = rng.getrandbits(256) | 1
+    p = [rng.randrange(-n, n) for _ in range(70)]
+    q = [rng.randrange(n) for _ in range(45)]
+    assert poly_mul(p, q, n) == _mul_referencia(p, q, n)
+
+
+def test_poly_mul_modular_karatsuba(monkeypatch):
+    import random
+    from lib.ataques.rsa_franklin_reiter import polynomial
+    monkeypatch.setattr(polynomial, "LIMITE_BYTES_KRONECKER", 512)
+    rng = random.Random(2)
+    n = rng.getrandbits(128) | 1
+    p = [rng.randrange(n) for _ in range(90)]
+    q = [rng.randrange(n) for _ in range(33)]
+    assert poly_mul(p, q, n) == _mul_referencia(p, q, n)
+
+
+def test_poly_divmod_modular_reconstroi_dividendo():
+    import random
+    rng = random.Random(3)
+    n = 1_000_003  # primo
+    p = [rng.randrange(n) for _ in range(200)]
+    q = [rng.randrange(n) for _ in range(7)] + [5]
+    quoc, rest = poly_divmod(p, q, n)
+    assert len(rest) < len(q)
+    assert poly_add(poly_mul(quoc, q, n), rest, n) == poly_normalize(p, n)
+
+
+def test_poly_divmod_inverso_pre_calculado():
+    n = 97
+    p = [3, 0, 5, 1, 7]
+    q = [1, 2, 4]
+    assert poly_divmod(p, q, n, q_lider_inv=pow(4, -1, n)) == poly_divmod(p, q, n)
+
+
+def test_poly_gcd_modular_fator_comum():
+    n = 1_000_003
+    fator = [n - 5, 1]  # x - 5
+    p = poly_mul(fator, [1, 2, 3], n)
+    q = poly_mul(fator, [7, 1], n)
+    g = poly_gcd(p, q, n)
+    assert len(g) == 2
+    assert poly_eval(g, 5, n) == 0
+
+
+def test_poly_gcd_half_gcd_igual_a_euclides(monkeypatch):
+    import random
+    from lib.ataques.rsa_franklin_reiter import polynomial
+    monkeypatch.setattr(polynomial, "LIMIAR_HALF_GCD", 4)
+    monkeypatch.setattr(polynomial, "LIMIAR_HALF_GCD_BASE", 2)
+    monkeypatch.setattr(polynomial, "LIMIAR_DIVISAO_NEWTON", 3)
+    rng = random.Random(4)
+    n = 1_000_003
+    fator = [rng.randrange(n) for _ in range(6)] + [1]
+    p = poly_mul(fator, [rng.randrange(n) for _ in range(40)] + [1], n)
+    q = poly_mul(fator, [rng.randrange(n) for _ in range(33)] + [1], n)
+
+    g = poly_gcd(p, q, n)
+    esperado = polynomial._mdc_euclides(p, q, n)
+    inv = pow(esperado[-1], -1, n)
+    assert g == [(c * inv) % n for c in esperado]
+    assert g == fator
+
+
+def test_poly_gcd_mesmo_resultado_nos_dois_caminhos(monkeypatch):
+    import random
+    from lib.ataques.rsa_franklin_reiter import polynomial
+    rng = random.Random(9)
+    n = 1_000_003
+    fator = [rng.randrange(n) for _ in range(5)] + [7]  # não mônico
+    p = poly_mul(fator, [rng.randrange(n) for _ in range(30)] + [3], n)
+    q = poly_mul(fator, [rng.randrange(n) for _ in range(21)] + [5], n)
+
+    euclides = poly_gcd(p, q, n)
+    monkeypatch.setattr(polynomial, "LIMIAR_HALF_GCD", 4)
+    monkeypatch.setattr(polynomial, "LIMIAR_HALF_GCD_BASE", 2)
+    monkeypatch.setattr(polynomial, "LIMIAR_DIVISAO_NEWTON", 3)
+    half_gcd = poly_gcd(p, q, n)
+    assert euclides == half_gcd
+    assert euclides[-1] == 1
+    assert euclides == [(c * pow(7, -1, n)) % n for c in fator]
+
+
+def test_half_gcd_caso_base_igual_a_recursao(monkeypatch):
+    import random
+    from lib.ataques.rsa_franklin_reiter import polynomial
+    monkeypatch.setattr(polynomial, "LIMIAR_DIVISAO_NEWTON", 3)
+    rng = random.Random(12)
+    n = 1_000_003
+    a = [rng.randrange(n) for _ in range(60)] + [1]
+    b = [rng.randrange(n) for _ in range(52)] + [1]
+    monkeypatch.setattr(polynomial, "LIMIAR_HALF_GCD_BASE", 1)
+    recursiva = polynomial._half_gcd(a, b, n)
+    monkeypatch.setattr(polynomial, "LIMIAR_HALF_GCD_BASE", 100)
+    assert polynomial._half_gcd(a, b, n) == recursiva
+    novo_a, novo_b = polynomial._aplicar(recursiva, a, b, n)
+    assert len(novo_b) - 1 < len(a) // 2 <= len(novo_a) - 1
+
+
+def test_poly_gcd_revela_fator_de_n():
+    from lib.ataques.rsa_franklin_reiter.polynomial import FatorEncontrado
+    p, q = 1009, 1013
+    n = p * q
+    with pytest.raises(FatorEncontrado) as erro:
+        poly_gcd([1, 0, 1], [5, p], n)  # líder p não é invertível mod n
+    assert erro.value.fator == p
+    assert isinstance(erro.value, RuntimeError)
+
+
+N_PEQUENO = 1000003
+
+
+def test_polinomio_mod_n_normaliza_e_grau():
+    p = PolinomioModN([N_PEQUENO + 1, 2, 0, 0], N_PEQUENO)
+    assert p.grau == 1
+    assert p.para_lista() == [1, 2]
+    assert PolinomioModN([0, 0], N_PEQUENO).eh_zero()
+    assert PolinomioModN([], N_PEQUENO).para_lista() == [0]
+
+
+def test_polinomio_mod_n_operacoes_no_lugar():
+    p = PolinomioModN([1, 2, 3], N_PEQUENO)
+    buffer = p.coefs
+    p.iadd(PolinomioModN([1, 1, 1, 1], N_PEQUENO))
+    p.imul_scalar(2)
+    assert p.coefs is buffer
+    assert p.para_lista() == [4, 6, 8, 2]
+    p.isub(PolinomioModN([4, 6, 8, 2], N_PEQUENO))
+    assert p.eh_zero()
+
+
+def test_polinomio_mod_n_imod_igual_a_poly_divmod():
+    import random
+    rng = random.Random(7)
+    a = [rng.randrange(N_PEQUENO) for _ in range(40)]
+    b = [rng.randrange(N_PEQUENO) for _ in range(9)]
+    p = PolinomioModN(a, N_PEQUENO)
+    p.imod(PolinomioModN(b, N_PEQUENO))
+    assert p.para_lista() == poly_divmod(a, b, N_PEQUENO)[1]
+
+
+def test_polinomio_mod_n_truncar_e_visao():
+    p = PolinomioModN([1, 2, 3, 4, 5], N_PEQUENO)
+    alto = p.visao(2)
+    baixo = p.visao(0, 2)
+    assert alto.para_lista() == [3, 4, 5]
+    assert baixo.para_lista() == [1, 2]
+    assert alto.coefs is p.coefs
+
+    # alterar uma visão não altera o original, nem o contrário
+    alto.iadd(PolinomioModN([1], N_PEQUENO))
+    p.imul_scalar(10)
+    assert alto.para_lista() == [4, 4, 5]
+    assert baixo.para_lista() == [1, 2]
+    assert p.para_lista() == [10, 20, 30, 40, 50]
+
+    p.truncar(2)
+    assert p.para_lista() == [10, 20]
+    p.iadd(PolinomioModN([0, 0, 7], N_PEQUENO))
+    assert p.para_lista() == [10, 20, 7]
+
+
+def test_polinomio_mod_n_visao_alem_do_grau():
+    p = PolinomioModN([1, 2, 3], 97)
+    for visao in (p.visao(5), p.visao(3), p.visao(2, 1)):
+        assert visao.grau == -1
+        assert len(visao) == 0
+        assert visao.para_lista() == [0]
+    alto = p.visao(5)
+    alto.iadd(PolinomioModN([7], 97))
+    assert alto.para_lista() == [7]
+    assert p.para_lista() == [1, 2, 3]
+
+
+def test_polinomio_mod_n_mdc_e_produto():
+    import random
+    rng = random.Random(8)
+    fator = PolinomioModN([3, 1], N_PEQUENO)
+    a = PolinomioModN([rng.randrange(N_PEQUENO) for _ in range(30)], N_PEQUENO) * fator
+    b = PolinomioModN([rng.randrange(N_PEQUENO) for _ in range(20)], N_PEQUENO) * fator
+    g = a.mdc(b)
+    g.imul_scalar(pow(g.lider(), -1, N_PEQUENO))
+    assert g == fator
+    assert a.avaliar(N_PEQUENO - 3) == 0
+
+
+def test_operacoes_com_contexto_barrett():
+    import random
+    from lib.ataques.rsa_franklin_reiter.aritmetica_modular import ContextoModular
+    n = ((1 << 521) - 1) * ((1 << 607) - 1)
+    rng = random.Random(9)
+    p = [rng.randrange(n) for _ in range(70)]
+    q = [rng.randrange(n) for _ in range(20)] + [1]
+    contexto = ContextoModular(n, barrett=True)
+
+    assert poly_mul(p, q, n, contexto=contexto) == poly_mul(p, q, n)
+    assert poly_divmod(p, q, n, contexto=contexto) == poly_divmod(p, q, n)
+    assert poly_gcd(p, q, n, contexto=contexto) == poly_gcd(p, q, n)
+    assert poly_eval(p, 987654321, n, contexto=contexto) == poly_eval(p, 987654321, n)
@@ -0,0 +1,76 @@
+"""
+Testes unitários para pool_chaves.py
+Executar com: pytest -v
+"""
+
+import os
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.ataques.rsa_franklin_reiter.pool_chaves import (
+    PoolChaves,
+    gerar_chaves_paralelo,
+    gerar_chave_completa,
+)
+from lib.ataques.rsa_franklin_reiter.gerador_casos import (
+    definir_pool_chaves,
+    gerador_caso_relacionado_linear,
+)
+
+
+def _chave_valida(n, e, d, p, q):
+    return n == p * q and (e * d) % ((p - 1) * (q - 1)) == 1
+
+
+def test_gerar_chave_completa_mantem_e():
+    n, e, d, p, q = gerar_chave_completa(128, 3)
+    assert e == 3
+    assert _chave_valida(n, e, d, p, q)
+
+
+def test_gerar_chaves_paralelo():
+    (e, n), (d, p, q) = gerar_chaves_paralelo(128, 65537)
+    assert p != q
+    assert _chave_valida(n, e, d, p, q)
+
+
+def test_pool_persiste_e_consome(tmp_path):
+    with PoolChaves(str(tmp_path), alvo=3, max_processos=2) as pool:
+        pool.repor(128, 3)
+        chave = pool.retirar(128, 3)
+        assert _chave_valida(*chave)
+        pool.fechar(esperar=True)
+        restantes = pool.disponiveis(128, 3)
+
+    assert restantes >= 2
+    reaberto = PoolChaves(str(tmp_path), alvo=3)
+    assert reaberto.disponiveis(128, 3) == restantes
+    assert chave not in [reaberto.retirar(128, 3) for _ in range(restantes)]
+    reaberto.fechar()
+
+
+def test_retirar_persiste_sem_fechar(tmp_path):
+    with PoolChaves(str(tmp_path), alvo=2, minimo=0, max_processos=2) as pool:
+        pool.repor(128, 3)
+        pool.fechar(esperar=True)
+
+    pool = PoolChaves(str(tmp_path), alvo=2, minimo=0)
+    chave = pool.retirar(128, 3)
+    # sem fechar(): outro pool no mesmo diretório já não vê a chave
+    outro = PoolChaves(str(tmp_path), alvo=2, minimo=0)
+    assert outro.disponiveis(128, 3) == 1
+    assert outro.retirar(128, 3) != chave
+
+
+def test_gerador_casos_usa_pool(tmp_path):
+    with PoolChaves(str(tmp_path), alvo=2, max_processos=2) as pool:
+        definir_pool_chaves(pool)
+        try:
+            caso = gerador_caso_relacionado_linear(bits=256, e_inicial=3, m1=42)
+        finally:
+            definir_pool_chaves(None)
+    assert caso["e"] == 3
+    assert pow(caso["c1"], caso["d"], caso["n"]) == 42
@@ -18,6 +18,13 @@ from crypto_io import (
     escrever_bytes,
     ler_texto,
     escrever_texto,
+    iterar_texto,
+    EscritorTexto,
+    escrever_texto_em_blocos,
+    mapear_bytes,
+    liberar_mapa,
+    bytes_mapeados,
+    TextoMapeado,
     texto_para_inteiro,
     inteiro_para_texto,
 )
@@ -88,6 +95,106 @@ def test_escrever_texto_tipo_invalido(tmp_path):
         escrever_texto(tmp_path / "y", 1234)
 
 
+# ===============================
+# Testes: leitura e escrita em blocos
+# ===============================
+
+def test_iterar_texto_blocos_cortando_multibyte(tmp_path):
+    caminho = tmp_path / "texto.txt"
+    conteudo = "çãé" * 50
+    escrever_texto(str(caminho), conteudo)
+    blocos = list(iterar_texto(str(caminho), tamanho_bloco=5))
+    assert len(blocos) > 1
+    assert "".join(blocos) == conteudo
+
+
+def test_iterar_texto_arquivo_inexistente():
+    with pytest.raises(FileNotFoundError):
+        iterar_texto("nao_existe.txt")
+
+
+def test_iterar_texto_abre_so_ao_iterar(tmp_path):
+    caminho = tmp_path / "texto.txt"
+    escrever_texto(str(caminho), "abc")
+    blocos = iterar_texto(str(caminho))
+    caminho.unlink()
+    # o arquivo não foi aberto na chamada: sumiu antes da primeira iteração
+    with pytest.raises(FileNotFoundError):
+        next(blocos)
+
+
+def test_escritor_texto_descarregar_grava_no_arquivo(tmp_path):
+    caminho = tmp_path / "texto.txt"
+    with EscritorTexto(str(caminho), tamanho_buffer=1 << 20) as escritor:
+        escritor.escrever("ação " * 1000)
+        assert caminho.read_bytes() == b""
+        escritor.descarregar()
+        assert caminho.read_text(encoding="utf-8") == "ação " * 1000
+
+
+def test_escritor_texto_buffer_pequeno(tmp_path):
+    caminho = tmp_path / "saida" / "texto.txt"
+    with EscritorTexto(str(caminho), tamanho_buffer=4, fsync="a_cada_bloco") as escritor:
+        escritor.escrever("coração ")
+        escritor.escrever_blocos(["em ", "blocos"])
+    assert ler_texto(str(caminho)) == "coração em blocos"
+
+
+def test_escrever_texto_em_blocos_ida_e_volta(tmp_path):
+    origem = tmp_path / "origem.txt"
+    destino = tmp_path / "destino.txt"
+    escrever_texto(str(origem), "Ação! " * 100)
+    escrever_texto_em_blocos(str(destino), iterar_texto(str(origem), 7), fsync="ao_fechar")
+    assert ler_texto(str(destino)) == ler_texto(str(origem))
+
+
+def test_escritor_texto_fsync_invalido(tmp_path):
+    with pytest.raises(ValueError):
+        EscritorTexto(str(tmp_path / "x.txt"), fsync="sempre")
+
+
+# ===============================
+# Testes: leitura mapeada (mmap)
+# ===============================
+
+def test_mapear_bytes_somente_leitura(tmp_path):
+    caminho = tmp_path / "dados.bin"
+    escrever_bytes(str(caminho), b"\x01\x02\x03")
+    visao = mapear_bytes(str(caminho))
+    assert visao.readonly
+    assert bytes(visao) == b"\x01\x02\x03"
+    assert bytes_para_inteiro(visao) == 0x010203
+    mapa = visao.obj
+    liberar_mapa(visao)
+    assert mapa.closed
+
+
+def test_bytes_mapeados_fecha_na_saida(tmp_path):
+    caminho = tmp_path / "dados.bin"
+    escrever_bytes(str(caminho), b"abc")
+    with bytes_mapeados(str(caminho)) as visao:
+        mapa = visao.obj
+        assert bytes(visao) == b"abc"
+    assert mapa.closed
+    with pytest.raises(ValueError):
+        bytes(visao)
+
+
+def test_mapear_bytes_arquivo_vazio(tmp_path):
+    caminho = tmp_path / "vazio.bin"
+    escrever_bytes(str(caminho), b"")
+    assert len(mapear_bytes(str(caminho))) == 0
+
+
+def test_texto_mapeado_blocos_multibyte(tmp_path):
+    caminho = tmp_path / "texto.txt"
+    conteudo = "ação coração" * 10
+    escrever_texto(str(caminho), conteudo)
+    with TextoMapeado(str(caminho)) as texto:
+        assert "".join(texto.iterar(tamanho_bloco=3)) == conteudo
+        assert str(texto) == conteudo
+
+
 # ===============================
 # Testes: texto <-> inteiro
 # ===============================
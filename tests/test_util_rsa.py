@@ -0,0 +1,83 @@
+"""
+Testes unitários para util_rsa.py
+Executar com: pytest -v
+"""
+
+import os
+import sys
+import pytest
+
+# adiciona o diretório raiz ao PYTHONPATH
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.ataques.rsa_franklin_reiter.aritmetica_modular import crivo_primos, is_probable_prime
+from lib.ataques.rsa_franklin_reiter.util_rsa import (
+    generate_prime,
+    generate_rsa_keypair,
+    rsa_encrypt,
+    rsa_decrypt,
+    CRTPrivateKey,
+    rsa_encrypt_batch,
+    rsa_decrypt_batch,
+)
+
+
+def test_generate_prime_bits_pequenos():
+    primos = set(crivo_primos(1 << 12))
+    for bits in range(2, 13):
+        for _ in range(20):
+            p = generate_prime(bits)
+            assert p in primos
+            assert p.bit_length() == bits
+
+
+def test_generate_prime_512_bits():
+    p = generate_prime(512)
+    assert p.bit_length() == 512
+    assert is_probable_prime(p, 20)
+
+
+def test_generate_prime_bits_invalido():
+    with pytest.raises(ValueError):
+        generate_prime(1)
+
+
+def test_rsa_ida_e_volta():
+    pub, priv = generate_rsa_keypair(bits=256)
+    m = 123456789
+    assert rsa_decrypt(rsa_encrypt(m, pub), priv) == m
+
+
+def test_rsa_decrypt_reaproveita_valores_crt(monkeypatch):
+    from lib.ataques.rsa_franklin_reiter import util_rsa
+    pub, priv = generate_rsa_keypair(bits=256)
+    cs = [rsa_encrypt(m, pub) for m in (5, 6, 7)]
+    rsa_decrypt(cs[0], priv)
+
+    def falha(*args):
+        raise AssertionError("CRTPrivateKey recalculada")
+
+    monkeypatch.setattr(util_rsa, "modinv", falha)
+    assert [rsa_decrypt(c, priv) for c in cs] == [5, 6, 7]
+    chave = util_rsa._chave_crt(*priv)
+    assert [rsa_decrypt(c, chave) for c in cs] == [5, 6, 7]
+
+
+def test_crt_igual_a_pow_direto():
+    pub, priv = generate_rsa_keypair(bits=256)
+    e, N = pub
+    d, p, q = priv
+    chave = CRTPrivateKey(d, p, q)
+    for m in (0, 1, 2, N - 1, 123456789):
+        c = rsa_encrypt(m, pub)
+        assert chave.decrypt(c) == pow(c, d, N) == m
+
+
+def test_lote_sequencial_e_paralelo():
+    pub, priv = generate_rsa_keypair(bits=128)
+    ms = list(range(2, 60))
+    cs = rsa_encrypt_batch(ms, pub)
+    assert cs == [rsa_encrypt(m, pub) for m in ms]
+    assert rsa_decrypt_batch(cs, priv) == ms
+    assert rsa_decrypt_batch(cs, priv, processes=2) == ms
+    assert rsa_encrypt_batch(ms, pub, processes=2) == cs